@@ -1,7 +1,17 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 
+from app.core.profiling import RequestProfiler
+from app.dependencies.deps import get_request_profiler
+from app.domain.entities.principal import Principal
 from app.domain.entities.user import User
 from app.domain.entities.user_role import UserRole
+from app.domain.exceptions.exceptions import NotFoundError
+from app.schemas.profiling import (
+    ProfileSummaryResponse,
+    ProfilingArmRequest,
+    ProfilingStatusResponse,
+)
 from app.security.authorization import require_role
 
 admin_router = APIRouter(prefix="/admin", tags=["admin"])
@@ -9,6 +19,77 @@ admin_router = APIRouter(prefix="/admin", tags=["admin"])
 
 @admin_router.get("/dashboard")
 async def admin_dashboard(
-    _: User = Depends(require_role(UserRole.ADMIN)),
+    _: User | Principal = Depends(require_role(UserRole.ADMIN)),
 ):
     return {"message": "Welcome, admin"}
+
+
+# ---------------------------------------------------------------------
+# On-demand request profiling
+# ---------------------------------------------------------------------
+
+
+@admin_router.get("/profiling", response_model=ProfilingStatusResponse)
+async def profiling_status(
+    profiler: RequestProfiler = Depends(get_request_profiler),
+    _: User | Principal = Depends(require_role(UserRole.ADMIN)),
+):
+    return profiler.status()
+
+
+@admin_router.post("/profiling", response_model=ProfilingStatusResponse)
+async def arm_profiling(
+    body: ProfilingArmRequest,
+    profiler: RequestProfiler = Depends(get_request_profiler),
+    _: User | Principal = Depends(require_role(UserRole.ADMIN)),
+):
+    """
+    Arm the sampling profiler for the next N matching requests
+    or a percentage of them.
+    """
+    profiler.arm(
+        count=body.count,
+        percent=body.percent,
+        path_prefix=body.path_prefix,
+        duration_seconds=body.duration_seconds,
+    )
+    return profiler.status()
+
+
+@admin_router.delete("/profiling", response_model=ProfilingStatusResponse)
+async def disarm_profiling(
+    profiler: RequestProfiler = Depends(get_request_profiler),
+    _: User | Principal = Depends(require_role(UserRole.ADMIN)),
+):
+    profiler.disarm()
+    return profiler.status()
+
+
+@admin_router.get("/profiles", response_model=list[ProfileSummaryResponse])
+async def list_profiles(
+    profiler: RequestProfiler = Depends(get_request_profiler),
+    _: User | Principal = Depends(require_role(UserRole.ADMIN)),
+):
+    return [ProfileSummaryResponse.from_profile(p) for p in profiler.profiles()]
+
+
+@admin_router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(
+    profile_id: int,
+    profiler: RequestProfiler = Depends(get_request_profiler),
+    _: User | Principal = Depends(require_role(UserRole.ADMIN)),
+):
+    """
+    Collapsed stacks ("frame;frame;... count"), ready for
+    flamegraph.pl, speedscope or inferno.
+    """
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise NotFoundError("Profile not found")
+
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{profile.id}.folded"',
+        },
+    )
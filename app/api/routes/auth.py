@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, BackgroundTasks, status, Request
+from fastapi import APIRouter, Depends, BackgroundTasks, Query, status, Request
+from fastapi.responses import StreamingResponse
 from app.domain.entities.user import User
 from app.domain.entities.user_role import UserRole
 from app.domain.use_cases.user.list_users import ListUsersUseCase
@@ -13,8 +14,8 @@ from app.services.audit_service import AuditService
 from app.dependencies.deps import get_audit_service, settings
 from app.domain.event_type import EventType
 from app.security.dependencies import (
-    get_current_active_user,
     get_current_user,
+    principal_dependency,
 )
 
 from app.domain.use_cases.user.login_user import LoginUserUseCase
@@ -28,6 +29,9 @@ from app.core.safe_task import safe_task
 
 cfg = settings()
 
+USERS_PAGE_SIZE_DEFAULT = 100
+USERS_PAGE_SIZE_MAX = 1000
+
 # ---------------------------------------------------------------------
 # Public routes (no authentication)
 # ---------------------------------------------------------------------
@@ -107,7 +111,7 @@ async def login(
 protected_router = APIRouter(
     prefix="/auth",
     tags=["auth"],
-    dependencies=[Depends(get_current_active_user)],
+    dependencies=[Depends(principal_dependency())],
 )
 
 
@@ -127,12 +131,37 @@ async def me(
     dependencies=[Depends(require_role(UserRole.ADMIN))]
 )
 async def read_users(
+    limit: int = Query(USERS_PAGE_SIZE_DEFAULT, ge=1, le=USERS_PAGE_SIZE_MAX),
+    cursor: str | None = Query(None),
     use_case: ListUsersUseCase = Depends(get_list_users_use_case),
 ):
     """
-    Retrieve all users.
+    Retrieve users one page at a time.
 
+    Pass the returned `next_cursor` as `cursor` to get the next page.
     Authorization is enforced at the router level.
     """
-    users = await use_case.execute()
-    return UserListResponse.from_domain(users)
+    page = await use_case.execute(limit=limit, cursor=cursor)
+    return UserListResponse.from_domain(page.users, page.next_cursor)
+
+
+@protected_router.get(
+    "/users/stream",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_role(UserRole.ADMIN))]
+)
+async def stream_users(
+    use_case: ListUsersUseCase = Depends(get_list_users_use_case),
+):
+    """
+    Export all users as NDJSON (one UserResponse per line).
+
+    Rows are read through a server-side cursor, so memory use
+    does not grow with the number of users.
+    """
+
+    async def ndjson():
+        async for user in use_case.stream():
+            yield UserResponse.from_domain(user).model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -1,11 +1,15 @@
-from fastapi import APIRouter
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from fastapi import APIRouter, Depends
+from prometheus_client import CONTENT_TYPE_LATEST
 from fastapi.responses import Response
 
+from app.core.config import Settings
+from app.core.prometheus import render_metrics
+from app.dependencies.deps import settings
+
 router = APIRouter()
 
 
 @router.get("/metrics")
-def metrics():
-    data = generate_latest()
+def metrics(config: Settings = Depends(settings)):
+    data = render_metrics(config.prometheus_multiproc_dir)
     return Response(data, media_type=CONTENT_TYPE_LATEST)
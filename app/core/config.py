@@ -13,11 +13,34 @@ class Settings(BaseModel):
     app_name: str
     environment: str
     log_level: str
+    log_async: bool = False
+    log_queue_size: int = 10_000
+    log_overflow_policy: str = "drop_debug_first"  # "block" | "drop_debug_first" | "drop_all"
+    # Compact JSON lines via orjson (faster; no spaces, raw UTF-8). Off keeps
+    # the json.dumps byte format that existing log consumers parse
+    log_json_compact: bool = False
+    log_sampling_enabled: bool = True
+    # "<key>:sample:<N>" / "<key>:rate:<per_second>[:<burst>]", comma-separated; empty → defaults
+    log_sampling_rules: str = ""
+    log_sampling_report_interval_seconds: float = 60.0
+    access_log_enabled: bool = True  # one "http_request" line per request; 2xx/3xx probes and /metrics at DEBUG
 
     # --------------------
     # Database
     # --------------------
     database_url: str
+    # Read replicas (comma-separated DATABASE_REPLICA_URLS); empty → primary only
+    database_replica_urls: list[str] = []
+    db_replica_health_interval_seconds: float = 10.0
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100  # asyncpg prepared statements per connection
+    # Per-request warnings (possible N+1): statement count / same statement repeated
+    db_query_warn_threshold: int = 20
+    db_repeated_statement_threshold: int = 5
 
     # --------------------
     # JWT / Authentication
@@ -25,10 +48,94 @@ class Settings(BaseModel):
     jwt_secret_key: str
     jwt_algorithm: str
     jwt_access_token_expire_minutes: int
+    jwt_cache_max_entries: int = 10_000  # 0 disables the verified-token cache
+
+    # Claims-only (stateless) authorization: role guards trust the verified
+    # token instead of loading the user. Tokens are short-lived and carry a
+    # `ver` claim; bump JWT_TOKEN_VERSION to revoke every issued token.
+    auth_claims_only: bool = False
+    jwt_claims_only_expire_minutes: int = 5
+    jwt_token_version: int = 1
 
     db_timeout_seconds: int = 3
     login_rate_limit: str = "5/minute"
 
+    # --------------------
+    # Password hashing
+    # --------------------
+    password_hash_executor: str = "thread"  # "thread" | "process"
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+
+    # --------------------
+    # Audit buffer
+    # --------------------
+    audit_buffer_max_size: int = 10_000
+    audit_batch_size: int = 100
+    audit_flush_interval_seconds: float = 1.0
+    audit_buffer_overflow: str = "drop"  # "drop" | "block"
+
+    # --------------------
+    # Principal cache (resolved users for authenticated requests)
+    # Invalidation on user update is per process: with several workers, a
+    # deactivated or demoted user keeps access on the other workers for up
+    # to PRINCIPAL_CACHE_TTL_SECONDS.
+    # --------------------
+    principal_cache_ttl_seconds: float = 30.0  # 0 disables the cache
+    principal_cache_max_entries: int = 10_000
+
+    # --------------------
+    # Metrics
+    # --------------------
+    # Distinct route-template labels before new ones fold into "__other__"
+    metrics_max_path_labels: int = 200
+    # Set → multiprocess mode (one mmap file per worker, merged on scrape)
+    prometheus_multiproc_dir: str | None = None
+
+    # --------------------
+    # Tracing
+    # --------------------
+    tracing_enabled: bool = True  # False → no provider, no instrumentation, `traced` is a no-op
+    tracing_sample_ratio: float = 1.0  # root spans; children follow their parent
+    tracing_exporter_endpoint: str = "localhost:4317"
+    # Keep rule (ratio < 1 only, opt-in): export unsampled traces that
+    # errored / were slow. Every unsampled span is then still recorded and
+    # buffered until its trace ends, so CPU and memory stay close to
+    # ratio=1.0; only export volume drops.
+    tracing_keep_errors: bool = False
+    tracing_slow_threshold_ms: float = 0.0  # > 0 enables the slow rule
+    # Per-stage timings from `@traced` names, logged on the access line
+    # (needs tracing_enabled: with tracing off, `traced` does nothing)
+    server_timing_enabled: bool = True
+    # Also send them as a Server-Timing header, to ADMIN callers only
+    # (reveals internals; off unless SERVER_TIMING_HEADER is set)
+    server_timing_header: bool = False
+
+    # --------------------
+    # Profiling (armed on demand via /admin/profiling)
+    # --------------------
+    profiling_max_profiles: int = 50  # ring buffer of captured profiles
+    profiling_interval_ms: float = 5.0
+    profiling_max_samples: int = 20_000  # per profile
+
+    # --------------------
+    # Event loop monitor
+    # --------------------
+    loop_lag_interval_seconds: float = 0.5
+    # Watchdog that logs the stack of callbacks holding the loop (debug)
+    loop_block_detection: bool = False
+    loop_block_threshold_ms: float = 100.0
+
+    # --------------------
+    # Traffic recording (sampled requests → rotating JSONL, for replay)
+    # --------------------
+    traffic_recording_enabled: bool = False
+    traffic_recording_path: str = "traffic/traffic.jsonl"
+    traffic_recording_sample_rate: float = 0.01  # fraction of requests kept
+    traffic_recording_max_bytes: int = 50 * 1024 * 1024  # per file, then rotate
+    traffic_recording_backup_count: int = 5
+    traffic_recording_max_body_bytes: int = 64 * 1024  # larger bodies: size only
+
 
 def get_settings() -> Settings:
     return Settings(
@@ -36,12 +143,66 @@ def get_settings() -> Settings:
         app_name=os.getenv("APP_NAME", "AI Engineer Foundation"),
         environment=os.getenv("ENVIRONMENT", "local"),
         log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        log_async=os.getenv(
+            "LOG_ASYNC",
+            "false",
+        ).lower() in ("1", "true", "yes"),
+        log_queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+        log_overflow_policy=os.getenv(
+            "LOG_OVERFLOW_POLICY",
+            "drop_debug_first",
+        ).lower(),
+        log_json_compact=os.getenv(
+            "LOG_JSON_COMPACT",
+            "false",
+        ).lower() in ("1", "true", "yes"),
+        log_sampling_enabled=os.getenv(
+            "LOG_SAMPLING_ENABLED",
+            "true",
+        ).lower() in ("1", "true", "yes"),
+        log_sampling_rules=os.getenv("LOG_SAMPLING_RULES", ""),
+        log_sampling_report_interval_seconds=float(
+            os.getenv("LOG_SAMPLING_REPORT_INTERVAL_SECONDS", "60")
+        ),
+        access_log_enabled=os.getenv(
+            "ACCESS_LOG_ENABLED",
+            "true",
+        ).lower() in ("1", "true", "yes"),
 
         # Database
         database_url=os.getenv(
             "DATABASE_URL",
             "sqlite+aiosqlite:///./app.db",
         ),
+        database_replica_urls=[
+            url.strip()
+            for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+            if url.strip()
+        ],
+        db_replica_health_interval_seconds=float(
+            os.getenv("DB_REPLICA_HEALTH_INTERVAL_SECONDS", "10")
+        ),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        db_pool_timeout_seconds=float(
+            os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")
+        ),
+        db_pool_recycle_seconds=int(
+            os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")
+        ),
+        db_pool_pre_ping=os.getenv(
+            "DB_POOL_PRE_PING",
+            "true",
+        ).lower() in ("1", "true", "yes"),
+        db_statement_cache_size=int(
+            os.getenv("DB_STATEMENT_CACHE_SIZE", "100")
+        ),
+        db_query_warn_threshold=int(
+            os.getenv("DB_QUERY_WARN_THRESHOLD", "20")
+        ),
+        db_repeated_statement_threshold=int(
+            os.getenv("DB_REPEATED_STATEMENT_THRESHOLD", "5")
+        ),
 
         # JWT
         jwt_secret_key=os.getenv(
@@ -55,6 +216,126 @@ def get_settings() -> Settings:
         jwt_access_token_expire_minutes=int(
             os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30")
         ),
+        jwt_cache_max_entries=int(
+            os.getenv("JWT_CACHE_MAX_ENTRIES", "10000")
+        ),
+        auth_claims_only=os.getenv(
+            "AUTH_CLAIMS_ONLY",
+            "false",
+        ).lower() in ("1", "true", "yes"),
+        jwt_claims_only_expire_minutes=int(
+            os.getenv("JWT_CLAIMS_ONLY_EXPIRE_MINUTES", "5")
+        ),
+        jwt_token_version=int(
+            os.getenv("JWT_TOKEN_VERSION", "1")
+        ),
+
+        # Password hashing
+        password_hash_executor=os.getenv(
+            "PASSWORD_HASH_EXECUTOR",
+            "thread",
+        ).lower(),
+        password_hash_workers=int(
+            os.getenv("PASSWORD_HASH_WORKERS", "4")
+        ),
+        password_hash_max_pending=int(
+            os.getenv("PASSWORD_HASH_MAX_PENDING", "64")
+        ),
+
+        # Audit buffer
+        audit_buffer_max_size=int(
+            os.getenv("AUDIT_BUFFER_MAX_SIZE", "10000")
+        ),
+        audit_batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "100")),
+        audit_flush_interval_seconds=float(
+            os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1")
+        ),
+        audit_buffer_overflow=os.getenv(
+            "AUDIT_BUFFER_OVERFLOW",
+            "drop",
+        ).lower(),
+
+        # Principal cache
+        principal_cache_ttl_seconds=float(
+            os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30")
+        ),
+        principal_cache_max_entries=int(
+            os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000")
+        ),
+
+        # Metrics
+        metrics_max_path_labels=int(
+            os.getenv("METRICS_MAX_PATH_LABELS", "200")
+        ),
+        prometheus_multiproc_dir=os.getenv("PROMETHEUS_MULTIPROC_DIR") or None,
+
+        # Tracing
+        tracing_enabled=os.getenv(
+            "TRACING_ENABLED",
+            "true",
+        ).lower() in ("1", "true", "yes"),
+        tracing_sample_ratio=float(os.getenv("TRACING_SAMPLE_RATIO", "1.0")),
+        tracing_exporter_endpoint=os.getenv(
+            "TRACING_EXPORTER_ENDPOINT",
+            "localhost:4317",
+        ),
+        tracing_keep_errors=os.getenv(
+            "TRACING_KEEP_ERRORS",
+            "false",
+        ).lower() in ("1", "true", "yes"),
+        tracing_slow_threshold_ms=float(
+            os.getenv("TRACING_SLOW_THRESHOLD_MS", "0")
+        ),
+        server_timing_enabled=os.getenv(
+            "SERVER_TIMING_ENABLED",
+            "true",
+        ).lower() in ("1", "true", "yes"),
+        # Opt-in only: stage names / durations reveal internals (e.g. whether
+        # a password was verified), so never tied to ENVIRONMENT
+        server_timing_header=os.getenv(
+            "SERVER_TIMING_HEADER",
+            "false",
+        ).lower() in ("1", "true", "yes"),
+
+        # Profiling
+        profiling_max_profiles=int(os.getenv("PROFILING_MAX_PROFILES", "50")),
+        profiling_interval_ms=float(os.getenv("PROFILING_INTERVAL_MS", "5")),
+        profiling_max_samples=int(os.getenv("PROFILING_MAX_SAMPLES", "20000")),
+
+        # Event loop monitor
+        loop_lag_interval_seconds=float(
+            os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.5")
+        ),
+        # On by default where the app runs in debug mode (local)
+        loop_block_detection=os.getenv(
+            "LOOP_BLOCK_DETECTION",
+            "true" if os.getenv("ENVIRONMENT", "local") == "local" else "false",
+        ).lower() in ("1", "true", "yes"),
+        loop_block_threshold_ms=float(
+            os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100")
+        ),
+
+        # Traffic recording
+        traffic_recording_enabled=os.getenv(
+            "TRAFFIC_RECORDING_ENABLED",
+            "false",
+        ).lower() in ("1", "true", "yes"),
+        traffic_recording_path=os.getenv(
+            "TRAFFIC_RECORDING_PATH",
+            "traffic/traffic.jsonl",
+        ),
+        traffic_recording_sample_rate=float(
+            os.getenv("TRAFFIC_RECORDING_SAMPLE_RATE", "0.01")
+        ),
+        traffic_recording_max_bytes=int(
+            os.getenv("TRAFFIC_RECORDING_MAX_BYTES", str(50 * 1024 * 1024))
+        ),
+        traffic_recording_backup_count=int(
+            os.getenv("TRAFFIC_RECORDING_BACKUP_COUNT", "5")
+        ),
+        traffic_recording_max_body_bytes=int(
+            os.getenv("TRAFFIC_RECORDING_MAX_BODY_BYTES", str(64 * 1024))
+        ),
     )
 # Why this is correct
 
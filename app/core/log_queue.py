@@ -0,0 +1,159 @@
+import logging
+import queue
+import sys
+import threading
+from typing import TextIO
+
+from app.core.metrics import LOG_QUEUE_DEPTH, LOG_RECORDS_DROPPED
+from app.core.request_context import request_id_ctx
+
+OVERFLOW_POLICIES = ("block", "drop_debug_first", "drop_all")
+
+_STOP = object()
+
+
+class AsyncLogHandler(logging.Handler):
+    """
+    Non-blocking log handler: records go onto a bounded in-memory queue
+    and a dedicated thread formats and writes them in batches.
+
+    The calling thread only captures what depends on its context
+    (request id, merged message) and enqueues the record.
+
+    Overflow policies when the queue is full:
+    - block: wait for room (no loss, latency goes up)
+    - drop_debug_first: shed DEBUG once the queue is 80% full, then
+      everything below WARNING; WARNING and above still wait for room
+    - drop_all: never wait, drop whatever does not fit
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        queue_size: int = 10_000,
+        overflow_policy: str = "drop_debug_first",
+        batch_size: int = 256,
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown log overflow policy '{overflow_policy}'")
+
+        super().__init__()
+        self.stream = stream or sys.stdout
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._high_water = int(queue_size * 0.8)
+        self._policy = overflow_policy
+        self._batch_size = batch_size
+
+        self._thread = threading.Thread(
+            target=self._worker,
+            name="log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Caller side (event loop / request threads)
+    # ------------------------------------------------------------------
+
+    def _prepare(self, record: logging.LogRecord) -> None:
+        # Context vars are not visible from the writer thread
+        request_id = request_id_ctx.get()
+        if request_id:
+            record.request_id = request_id
+
+        # Freeze the message now; args may be mutated after the call
+        record.msg = record.getMessage()
+        record.args = None
+
+    def _drop(self, record: logging.LogRecord) -> None:
+        LOG_RECORDS_DROPPED.labels(record.levelname).inc()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if self._policy == "block":
+            self._queue.put(record)
+            return
+
+        if (
+            self._policy == "drop_debug_first"
+            and record.levelno < logging.INFO
+            and self._queue.qsize() >= self._high_water
+        ):
+            self._drop(record)
+            return
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            if self._policy == "drop_debug_first" and record.levelno >= logging.WARNING:
+                self._queue.put(record)
+            else:
+                self._drop(record)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _write_batch(self, batch: list[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+
+        if lines:
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            except Exception:
+                self.handleError(batch[-1])
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = []
+            stopping = item is _STOP
+            if not stopping:
+                batch.append(item)
+
+            while not stopping and len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            self._write_batch(batch)
+            LOG_QUEUE_DEPTH.set(self._queue.qsize())
+
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                self._queue.task_done()
+
+            if stopping:
+                return
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """
+        Block until every queued record has been written.
+        """
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        super().close()
@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from app.core.config import Settings
+from app.core.metrics import LOG_RECORDS_SUPPRESSED
+
+SAMPLING_LOGGER = "app.core.log_sampling"
+
+
+@dataclass(frozen=True)
+class SamplingRule:
+    """
+    How records matching `key` (an `event` extra or a logger name) are thinned.
+
+    - sample_every=N keeps 1 record in N (the first one is always kept)
+    - rate_per_second / burst is a token bucket: up to `burst` records at once,
+      refilled at `rate_per_second`
+    Both may be set; a record must pass both.
+    """
+
+    key: str
+    sample_every: int = 1
+    rate_per_second: float | None = None
+    burst: float = 1.0
+
+
+# Probe noise only; WARNING and above is never affected. Security events
+# (logins, auth failures) are never sampled by default: a brute-force or
+# credential-stuffing trail must stay complete. Opt in via LOG_SAMPLING_RULES.
+DEFAULT_RULES = (
+    SamplingRule("app.api.routes.health", rate_per_second=0.1, burst=5),
+    SamplingRule("app.domain.use_cases.health.check_health_status", rate_per_second=0.1, burst=5),
+)
+
+
+def parse_rules(spec: str) -> tuple[SamplingRule, ...]:
+    """
+    Parse LOG_SAMPLING_RULES.
+
+    Comma-separated entries, each one of:
+        <key>:sample:<N>
+        <key>:rate:<per_second>[:<burst>]
+    e.g. "user_login_attempt:sample:10,app.api.routes.health:rate:0.1:5"
+    """
+    rules = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+
+        parts = entry.split(":")
+        try:
+            key, mode, value = parts[0], parts[1], parts[2]
+            if mode == "sample" and len(parts) == 3:
+                rule = SamplingRule(key, sample_every=int(value))
+            elif mode == "rate" and len(parts) in (3, 4):
+                rate = float(value)
+                burst = float(parts[3]) if len(parts) == 4 else max(1.0, rate)
+                rule = SamplingRule(key, rate_per_second=rate, burst=burst)
+            else:
+                raise ValueError
+        except (IndexError, ValueError):
+            raise ValueError(f"Invalid log sampling rule '{entry}'")
+
+        if not key or rule.sample_every < 1 or (rule.rate_per_second is not None and rule.rate_per_second < 0):
+            raise ValueError(f"Invalid log sampling rule '{entry}'")
+        rules.append(rule)
+
+    return tuple(rules)
+
+
+class _RuleState:
+    __slots__ = ("rule", "seen", "tokens", "refilled_at")
+
+    def __init__(self, rule: SamplingRule, now: float):
+        self.rule = rule
+        self.seen = 0
+        self.tokens = rule.burst
+        self.refilled_at = now
+
+    def allow(self, now: float) -> bool:
+        rule = self.rule
+
+        self.seen += 1
+        if rule.sample_every > 1 and (self.seen - 1) % rule.sample_every:
+            return False
+
+        if rule.rate_per_second is not None:
+            elapsed = now - self.refilled_at
+            self.refilled_at = now
+            self.tokens = min(rule.burst, self.tokens + elapsed * rule.rate_per_second)
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+
+        return True
+
+
+class EventSamplingFilter(logging.Filter):
+    """
+    Handler filter that bounds log volume per event / logger.
+
+    - WARNING and above always pass
+    - A record's `event` extra is matched first, then its logger name
+      (exact, or any dotted parent, e.g. "app.api" matches "app.api.routes.health")
+    - Records without a rule pass untouched
+    - Suppressed counts are logged as one `log_records_suppressed` record
+      per `report_interval_seconds` (checked on the next record, no thread)
+
+    Runs in Handler.handle() before emit, so dropped records are never
+    formatted or queued.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, report_interval_seconds: float = 60.0):
+        super().__init__()
+        now = time.monotonic()
+        self._states = {rule.key: _RuleState(rule, now) for rule in rules}
+        self._logger_cache: dict[str, _RuleState | None] = {}
+        self._report_interval = report_interval_seconds
+        self._next_report = now + report_interval_seconds
+        self._suppressed: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rule_for_logger(self, name: str) -> "_RuleState | None":
+        try:
+            return self._logger_cache[name]
+        except KeyError:
+            pass
+
+        state = None
+        candidate = name
+        while candidate:
+            state = self._states.get(candidate)
+            if state is not None:
+                break
+            candidate = candidate.rpartition(".")[0]
+
+        self._logger_cache[name] = state
+        return state
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or record.name == SAMPLING_LOGGER:
+            return True
+
+        event = record.__dict__.get("event")
+        state = self._states.get(event) if isinstance(event, str) else None
+        if state is None:
+            state = self._rule_for_logger(record.name)
+
+        now = time.monotonic()
+        report = None
+        with self._lock:
+            keep = state is None or state.allow(now)
+            if not keep:
+                self._suppressed[state.rule.key] = self._suppressed.get(state.rule.key, 0) + 1
+
+            if now >= self._next_report:
+                report = self._take_suppressed(now)
+
+        if not keep:
+            LOG_RECORDS_SUPPRESSED.labels(state.rule.key).inc()
+        if report:
+            self._emit_report(report)
+
+        if keep and state is not None and state.rule.sample_every > 1:
+            # Lets readers re-weight counts taken from sampled logs
+            record.sample_rate = state.rule.sample_every
+        return keep
+
+    def _take_suppressed(self, now: float) -> dict[str, int]:
+        suppressed, self._suppressed = self._suppressed, {}
+        self._next_report = now + self._report_interval
+        return suppressed
+
+    def _emit_report(self, suppressed: dict[str, int]) -> None:
+        # Own logger always passes, so re-entering filter() is safe
+        logging.getLogger(SAMPLING_LOGGER).info(
+            "Log records suppressed by sampling",
+            extra={
+                "event": "log_records_suppressed",
+                "suppressed": suppressed,
+                "interval_seconds": self._report_interval,
+            },
+        )
+
+    def report(self) -> None:
+        """
+        Log pending suppressed counts now (lifespan shutdown).
+        """
+        with self._lock:
+            suppressed = self._take_suppressed(time.monotonic())
+        if suppressed:
+            self._emit_report(suppressed)
+
+
+def build_sampling_filter(settings: Settings) -> EventSamplingFilter | None:
+    """
+    Filter from LOG_SAMPLING_* settings; None when sampling is disabled.
+    """
+    if not settings.log_sampling_enabled:
+        return None
+
+    rules = parse_rules(settings.log_sampling_rules) if settings.log_sampling_rules.strip() else DEFAULT_RULES
+    return EventSamplingFilter(
+        rules,
+        report_interval_seconds=settings.log_sampling_report_interval_seconds,
+    )
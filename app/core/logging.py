@@ -1,14 +1,29 @@
 import logging
 import sys
+import time
 from typing import Any, Dict
 import json
 from datetime import date, datetime, timezone
 from uuid import UUID
+
+try:  # optional fast encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+from app.core.log_queue import AsyncLogHandler
+from app.core.log_sampling import EventSamplingFilter
 from app.core.request_context import request_id_ctx
 
 
-def setup_logging(level: str) -> None:
-    configure_logging(level)
+def setup_logging(
+    level: str,
+    async_mode: bool = False,
+    queue_size: int = 10_000,
+    overflow_policy: str = "drop_debug_first",
+    sampling_filter: EventSamplingFilter | None = None,
+    json_compact: bool = False,
+) -> None:
+    configure_logging(level, async_mode, queue_size, overflow_policy, sampling_filter, json_compact)
     logging.getLogger("passlib").setLevel(logging.WARNING)
     logging.getLogger("passlib.handlers").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -35,35 +50,149 @@ STANDARD_ATTRS = {
 }
 
 
-class JsonFormatter(logging.Formatter):    
+# Attributes never copied as extra fields (request_id is emitted explicitly)
+_EXCLUDED_ATTRS = frozenset(STANDARD_ATTRS | {"request_id"})
+
+
+def _dumps_stdlib(log_record: dict) -> str:
+    return json.dumps(log_record)
+
+
+def _dumps_compact_stdlib(log_record: dict) -> str:
+    # Same shape as orjson: compact separators, non-ASCII kept as UTF-8
+    return json.dumps(log_record, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumps_orjson(log_record: dict) -> str:
+    try:
+        return orjson.dumps(log_record).decode()
+    except TypeError:
+        # Types orjson rejects (e.g. huge ints)
+        return _dumps_compact_stdlib(log_record)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record:
+    timestamp, level, logger, message, request_id (if any), then extras.
+
+    Hot path:
+    - timestamp comes from `record.created`; the second-level prefix
+      is formatted once per second and reused
+    - extra-field keys are found with a single set difference
+
+    Encoding:
+    - default: `json.dumps` with its defaults, byte for byte the format
+      this formatter has always written
+    - compact=True (LOG_JSON_COMPACT): orjson when installed, which is
+      faster but writes compact JSON (`{"a":1,"b":"é"}`: no spaces after
+      `,` and `:`, raw UTF-8 instead of `\\u` escapes); stdlib json in
+      the same shape otherwise
+    """
+
+    def __init__(self, *args, compact: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") - replaced atomically
+        self._second_cache: tuple[int, str] = (-1, "")
+        if not compact:
+            self._dumps = _dumps_stdlib
+        elif orjson is not None:
+            self._dumps = _dumps_orjson
+        else:
+            self._dumps = _dumps_compact_stdlib
+
+    def _timestamp(self, created: float) -> str:
+        # Rounded like datetime.fromtimestamp (half-even, carried into the second)
+        second = int(created)
+        micros = round((created - second) * 1_000_000)
+        if micros == 1_000_000:
+            second += 1
+            micros = 0
+
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+
+        # Same shape as datetime.isoformat(): no fraction when it is zero
+        if micros:
+            return f"{prefix}.{micros:06d}+00:00"
+        return f"{prefix}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # ✅ request correlation
-        request_id = request_id_ctx.get()
+        attrs = record.__dict__
+
+        # ✅ request correlation (captured on the record by AsyncLogHandler,
+        # since the writer thread cannot see the request's context)
+        request_id = attrs.get("request_id") or request_id_ctx.get()
         if request_id:
             log_record["request_id"] = request_id
 
-        # ✅ capture extra fields properly
-        for key, value in record.__dict__.items():
-            if key not in STANDARD_ATTRS:
-                if isinstance(value, (UUID, datetime, date)):
-                    log_record[key] = str(value)
-                else:
-                    log_record[key] = value
+        # ✅ capture extra fields properly (insertion order preserved)
+        extra_keys = attrs.keys() - _EXCLUDED_ATTRS
+        if extra_keys:
+            for key, value in attrs.items():
+                if key in extra_keys:
+                    if isinstance(value, (UUID, datetime, date)):
+                        log_record[key] = str(value)
+                    else:
+                        log_record[key] = value
+
+        return self._dumps(log_record)
+
 
-        return json.dumps(log_record)
+def configure_logging(
+    log_level: str = "INFO",
+    async_mode: bool = False,
+    queue_size: int = 10_000,
+    overflow_policy: str = "drop_debug_first",
+    sampling_filter: EventSamplingFilter | None = None,
+    json_compact: bool = False,
+) -> None:
+    """
+    Install the JSON handler on the root logger.
 
+    - async_mode=False: synchronous write to stdout on the calling thread
+    - async_mode=True: bounded queue + writer thread (AsyncLogHandler)
+    - sampling_filter: drops sampled / rate-limited records before they
+      are formatted or queued
+    - json_compact: compact (orjson) encoding, see JsonFormatter
+    """
+    if async_mode:
+        handler = AsyncLogHandler(
+            sys.stdout,
+            queue_size=queue_size,
+            overflow_policy=overflow_policy,
+        )
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter(compact=json_compact))
+    if sampling_filter is not None:
+        handler.addFilter(sampling_filter)
 
-def configure_logging(log_level: str = "INFO") -> None:
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JsonFormatter())
     root = logging.getLogger()
     root.setLevel(log_level)
+    # Stop writer threads of a previous configuration (app re-created in tests)
+    for old_handler in root.handlers:
+        old_handler.close()
     root.handlers.clear()
-    root.addHandler(handler)
\ No newline at end of file
+    root.addHandler(handler)
+
+
+def flush_logging() -> None:
+    """
+    Write out everything still queued (lifespan shutdown),
+    including pending sampling counts.
+    """
+    for handler in logging.getLogger().handlers:
+        for log_filter in handler.filters:
+            if isinstance(log_filter, EventSamplingFilter):
+                log_filter.report()
+        handler.flush()
\ No newline at end of file
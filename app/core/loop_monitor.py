@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from app.core.metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+# Innermost frames kept in a blocked-loop report
+_STACK_LIMIT = 30
+
+
+def _request_of(frame) -> tuple[str | None, str | None]:
+    """
+    (route, request_id) of the request whose code is on the stack.
+
+    The watchdog runs on its own thread, so it cannot read the loop's
+    context vars; instead it finds the innermost ASGI `scope` local.
+    RequestContextMiddleware mirrors request_id_ctx into scope["state"].
+    """
+    while frame is not None:
+        scope = frame.f_locals.get("scope")
+        if isinstance(scope, dict) and scope.get("type") == "http":
+            route = getattr(scope.get("route"), "path", None) or scope.get("path")
+            request_id = (scope.get("state") or {}).get("request_id")
+            return route, request_id
+        frame = frame.f_back
+    return None, None
+
+
+class LoopMonitor:
+    """
+    Event-loop health, started and stopped by the app lifespan.
+
+    - Lag: a task sleeps `interval_seconds` and records how late it woke
+      up (event_loop_lag_seconds). Always on; one wake-up per interval.
+    - Blocking detector (debug): a watchdog thread posts a no-op callback
+      to the loop and, if it has not run within `block_threshold_ms`,
+      logs the loop thread's stack with the route and request id found
+      on it, then waits for the loop to recover before probing again.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.5,
+        block_threshold_ms: float = 100.0,
+        detect_blocking: bool = False,
+    ):
+        self._interval = interval_seconds
+        self._threshold = block_threshold_ms / 1000
+        self._detect_blocking = detect_blocking
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._measure_lag())
+
+        if self._detect_blocking:
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            # Watchdog waits on acks from this loop; don't block it here
+            await asyncio.to_thread(self._watchdog.join, 5)
+            self._watchdog = None
+
+    # ------------------------------------------------------------------
+    # Lag (event loop)
+    # ------------------------------------------------------------------
+
+    async def _measure_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            EVENT_LOOP_LAG.observe(max(0.0, loop.time() - expected))
+
+    # ------------------------------------------------------------------
+    # Blocking detector (watchdog thread)
+    # ------------------------------------------------------------------
+
+    def _report_blocked(self, loop_thread_id: int, blocked_since: float) -> None:
+        frame = sys._current_frames().get(loop_thread_id)
+        if frame is None:
+            return
+
+        route, request_id = _request_of(frame)
+        stack = traceback.format_stack(frame)[-_STACK_LIMIT:]
+        EVENT_LOOP_BLOCKED.inc()
+        logger.warning(
+            "Event loop blocked",
+            extra={
+                "event": "event_loop_blocked",
+                "blocked_ms": round((time.monotonic() - blocked_since) * 1000, 1),
+                "route": route,
+                "request_id": request_id,
+                "stack": "".join(stack),
+            },
+        )
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        while not self._stopping.is_set():
+            ack = threading.Event()
+            posted_at = time.monotonic()
+            try:
+                loop.call_soon_threadsafe(ack.set)
+            except RuntimeError:
+                return  # loop closed
+
+            if not ack.wait(self._threshold):
+                if self._stopping.is_set():
+                    return
+                self._report_blocked(loop_thread_id, posted_at)
+                # One report per stall: wait until the loop runs again
+                while not ack.wait(self._threshold):
+                    if self._stopping.is_set():
+                        return
+
+            self._stopping.wait(self._threshold)
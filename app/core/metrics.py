@@ -1,4 +1,8 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
+
+# Gauges declare how worker values are merged in multiprocess mode
+# (PROMETHEUS_MULTIPROC_DIR); "live*" modes ignore exited workers.
+# Counters and histograms are summed; ignored in single-process mode.
 
 # Total requests
 REQUEST_COUNT = Counter(
@@ -20,3 +24,148 @@ REQUEST_ERRORS = Counter(
     "HTTP request errors",
     ["method", "path"],
 )
+
+# Password hashing worker pool
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash/verify jobs waiting or running in the worker pool",
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_LATENCY = Histogram(
+    "password_hash_duration_seconds",
+    "Password hash/verify latency including pool wait",
+    ["operation"],
+)
+
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hash/verify jobs rejected because the pool was saturated",
+    ["operation"],
+)
+
+# In-process caches
+CACHE_HITS = Counter(
+    "cache_hits_total",
+    "In-process cache hits",
+    ["cache"],
+)
+
+CACHE_MISSES = Counter(
+    "cache_misses_total",
+    "In-process cache misses (including expired entries)",
+    ["cache"],
+)
+
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total",
+    "In-process cache entries evicted to stay within the size bound",
+    ["cache"],
+)
+
+# Database connection pool
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled DB connection",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "DB connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "DB connections open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Pool checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+
+DB_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "1 if the read replica is in rotation, 0 if failed over",
+    ["replica"],
+    # 0 as soon as any worker has failed the replica over
+    multiprocess_mode="livemin",
+)
+
+# Audit buffer
+AUDIT_BUFFER_DEPTH = Gauge(
+    "audit_buffer_depth",
+    "Audit events waiting to be flushed",
+    multiprocess_mode="livesum",
+)
+
+AUDIT_EVENTS_DROPPED = Counter(
+    "audit_events_dropped_total",
+    "Audit events that were never persisted",
+    ["reason"],
+)
+
+AUDIT_FLUSH_BATCH_SIZE = Histogram(
+    "audit_flush_batch_size",
+    "Audit events written per multi-row INSERT",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+# Async logging pipeline
+LOG_QUEUE_DEPTH = Gauge(
+    "log_queue_depth",
+    "Log records waiting for the writer thread",
+    multiprocess_mode="livesum",
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the log queue was full",
+    ["level"],
+)
+
+LOG_RECORDS_SUPPRESSED = Counter(
+    "log_records_suppressed_total",
+    "Log records suppressed by sampling / rate-limit rules",
+    ["rule"],
+)
+
+# Event loop health
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a timer that was due",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+EVENT_LOOP_BLOCKED = Counter(
+    "event_loop_blocked_total",
+    "Times the loop did not run a callback within the block threshold",
+)
+
+# Per-request DB accounting (RequestContextMiddleware + QueryStats)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries",
+    "DB statements issued per request",
+    ["method", "path"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 20, 35, 50, 100),
+)
+
+DB_TIME_PER_REQUEST = Histogram(
+    "http_request_db_seconds",
+    "Time spent in DB statements per request",
+    ["method", "path"],
+)
+
+# Traffic recorder (sampled requests written to JSONL for replay)
+TRAFFIC_RECORDS = Counter(
+    "traffic_records_total",
+    "Sampled requests handed to the traffic recorder",
+    ["outcome"],  # written / dropped (queue full) / failed (write error)
+)
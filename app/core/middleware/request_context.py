@@ -0,0 +1,226 @@
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    REQUEST_COUNT,
+    REQUEST_LATENCY,
+    REQUEST_ERRORS,
+)
+from app.core.request_context import request_id_ctx
+from app.core.server_timing import (
+    StageTimings,
+    format_server_timing,
+    server_timing_ctx,
+)
+from app.db.query_stats import QueryStats, query_stats_ctx
+
+logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("app.access")
+
+# Label for anything that did not match a route (scanners, typos) or
+# arrived after the label cap was reached
+OTHER_PATH = "__other__"
+
+# Role whose responses may carry the Server-Timing header; set on
+# scope["state"] by the auth dependencies once the caller is resolved
+SERVER_TIMING_ROLE = "ADMIN"
+
+# Probe and scrape endpoints: successful calls are logged at DEBUG so
+# they do not flood the INFO access log (one line per probe interval)
+QUIET_PATHS = frozenset({"/health/live", "/health/ready", "/metrics"})
+
+KNOWN_METHODS = frozenset({
+    "GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT",
+})
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware for per-request context and HTTP metrics.
+
+    In a single pass (no extra task, no body wrapping):
+    - Reuses the incoming X-Request-ID or generates one
+    - Exposes it via `request_id_ctx` and the X-Request-ID response header
+    - Records request count, latency and errors in Prometheus
+    - Counts DB statements / DB time of the request (QueryStats), exports
+      them per route, puts them on the access log line and warns on
+      likely N+1 patterns (too many statements, or one shape repeated)
+    - Collects per-stage timings from `@traced` (StageTimings) for the
+      access log and, if enabled, a Server-Timing header for ADMIN callers
+    - Logs one `http_request` access line per request; successful calls
+      to `quiet_paths` (probes, /metrics) go out at DEBUG instead of INFO
+
+    Metric labels stay bounded: `path` is the matched route template,
+    read from the scope after routing; unmatched paths and any new
+    template past `max_path_labels` fold into `__other__`, unknown
+    methods into `OTHER`.
+
+    Replaces RequestIDMiddleware + MetricsMiddleware (BaseHTTPMiddleware),
+    which each spawned a task and buffered streaming responses.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_path_labels: int = 200,
+        access_log: bool = True,
+        query_warn_threshold: int = 20,
+        repeated_statement_threshold: int = 5,
+        server_timing: bool = True,
+        server_timing_header: bool = False,
+        quiet_paths: frozenset[str] = QUIET_PATHS,
+    ):
+        self.app = app
+        self.max_path_labels = max_path_labels
+        self.access_log = access_log
+        self.query_warn_threshold = query_warn_threshold
+        self.repeated_statement_threshold = repeated_statement_threshold
+        self.server_timing = server_timing
+        self.server_timing_header = server_timing and server_timing_header
+        self.quiet_paths = quiet_paths
+        self._path_labels: set[str] = set()
+
+    def _path_label(self, scope: Scope) -> str:
+        # Set by the router once it has matched; absent for 404s
+        route = scope.get("route")
+        path = getattr(route, "path", None)
+        if not path:
+            return OTHER_PATH
+
+        if path not in self._path_labels:
+            if len(self._path_labels) >= self.max_path_labels:
+                return OTHER_PATH
+            self._path_labels.add(path)
+        return path
+
+    @staticmethod
+    def _stage_ms(timings: StageTimings, stats: QueryStats, start: float) -> dict[str, float]:
+        """
+        Stages at response start: `@traced` names, then db, serialize, total.
+
+        serialize = last traced stage end → response start, i.e. response
+        model validation + JSON encoding after the use case returned.
+        """
+        now = time.perf_counter()
+        stages = timings.as_ms()
+        stages["db"] = round(stats.seconds * 1000, 3)
+        if timings.last_end is not None:
+            stages["serialize"] = round((now - timings.last_end) * 1000, 3)
+        stages["total"] = round((now - start) * 1000, 3)
+        return stages
+
+    @staticmethod
+    def _is_timing_caller(scope: Scope) -> bool:
+        # Unauthenticated callers never get it: stage presence alone
+        # (e.g. password_verify) would reveal which accounts exist
+        return (scope.get("state") or {}).get("principal_role") == SERVER_TIMING_ROLE
+
+    def _check_queries(self, stats: QueryStats, method: str, path: str) -> None:
+        if stats.count > self.query_warn_threshold:
+            logger.warning(
+                "High DB statement count for one request",
+                extra={
+                    "event": "db_query_count_high",
+                    "method": method,
+                    "path": path,
+                    "db_queries": stats.count,
+                    "threshold": self.query_warn_threshold,
+                },
+            )
+
+        for shape, count in stats.repeated(self.repeated_statement_threshold).items():
+            logger.warning(
+                "Same DB statement repeated in one request (possible N+1)",
+                extra={
+                    "event": "db_statement_repeated",
+                    "method": method,
+                    "path": path,
+                    "statement": shape[:500],
+                    "count": count,
+                },
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 1️⃣ Use incoming request ID if present (gateway / proxy support)
+        request_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+        start = time.perf_counter()
+        status = 500  # ✅ default fallback for exceptions
+
+        stats = QueryStats()
+        timings = StageTimings() if self.server_timing else None
+        stage_ms: dict[str, float] = {}
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                # 4️⃣ Expose request_id in response
+                headers["X-Request-ID"] = request_id
+                if timings is not None:
+                    stage_ms.update(self._stage_ms(timings, stats, start))
+                    if self.server_timing_header and self._is_timing_caller(scope):
+                        headers["Server-Timing"] = format_server_timing(
+                            stage_ms,
+                            {"db": f"{stats.count} queries"},
+                        )
+            await send(message)
+
+        # 2️⃣ Store request_id in context (+ request.state, readable off-loop)
+        token = request_id_ctx.set(request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
+        stats_token = query_stats_ctx.set(stats)
+        timing_token = server_timing_ctx.set(timings)
+
+        try:
+            # 3️⃣ Process request
+            await self.app(scope, receive, send_wrapper)
+
+        except Exception:
+            REQUEST_ERRORS.labels(method, self._path_label(scope)).inc()
+            raise
+
+        finally:
+            duration = time.perf_counter() - start
+            path = self._path_label(scope)
+
+            REQUEST_COUNT.labels(method, path, status).inc()
+            REQUEST_LATENCY.labels(method, path).observe(duration)
+            DB_QUERIES_PER_REQUEST.labels(method, path).observe(stats.count)
+            DB_TIME_PER_REQUEST.labels(method, path).observe(stats.seconds)
+
+            self._check_queries(stats, method, path)
+            if self.access_log:
+                quiet = status < 400 and scope["path"] in self.quiet_paths
+                access_logger.log(
+                    logging.DEBUG if quiet else logging.INFO,
+                    "Request completed",
+                    extra={
+                        "event": "http_request",
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "route": path,
+                        "status": status,
+                        "duration_ms": round(duration * 1000, 3),
+                        "db_queries": stats.count,
+                        "db_time_ms": round(stats.seconds * 1000, 3),
+                        **({"timings": stage_ms} if stage_ms else {}),
+                    },
+                )
+
+            # 5️⃣ Clean up context (CRITICAL)
+            server_timing_ctx.reset(timing_token)
+            query_stats_ctx.reset(stats_token)
+            request_id_ctx.reset(token)
@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import TRAFFIC_RECORDS
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[redacted]"
+
+# Written with the value REDACTED (never the real value); replay swaps
+# the marker for its --header options
+SECRET_HEADERS = frozenset({
+    "authorization",
+    "proxy-authorization",
+    "cookie",
+    "x-api-key",
+    "x-auth-token",
+})
+
+# Query parameters whose name contains one of these are redacted
+SECRET_QUERY_PARTS = ("token", "password", "secret", "key")
+
+_STOP = object()
+
+
+def body_shape(value):
+    """
+    Structure of a JSON body with every leaf replaced by its type name:
+    {"email": "a@b.c", "tags": [1, 2]} → {"email": "str", "tags": ["int"]}.
+    Lists keep the shape of their first element only.
+    """
+    if isinstance(value, dict):
+        return {key: body_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [body_shape(value[0])] if value else []
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def _redact_query(query: str) -> str:
+    if not query:
+        return ""
+    pairs = parse_qsl(query, keep_blank_values=True)
+    return urlencode([
+        (name, REDACTED if any(part in name.lower() for part in SECRET_QUERY_PARTS) else value)
+        for name, value in pairs
+    ])
+
+
+class TrafficRecorder:
+    """
+    Writes sampled requests as JSON lines to a size-rotated file.
+
+    The request path only decides sampling and hands raw bytes to a
+    bounded queue; a writer thread redacts, reduces bodies to their
+    shape, serialises and writes. When the queue is full the record is
+    dropped (traffic_records_total{outcome="dropped"}), never waited on.
+
+    One line per request:
+    ts, method, path, route, query, headers, content_type, body_bytes,
+    body_shape, status, duration_ms, request_id
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: float = 0.01,
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 5,
+        max_body_bytes: int = 64 * 1024,
+        queue_size: int = 10_000,
+    ):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        self._written = TRAFFIC_RECORDS.labels("written")
+        self._dropped = TRAFFIC_RECORDS.labels("dropped")
+        self._failed = TRAFFIC_RECORDS.labels("failed")
+
+    def sample(self) -> bool:
+        return random.random() < self.sample_rate
+
+    def submit(self, entry: dict) -> None:
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._dropped.inc()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush queued records and stop the writer (app shutdown).
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        self._queue.put(_STOP)
+        writer.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._write_loop,
+                name="traffic-recorder",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _to_line(self, entry: dict) -> str:
+        headers = {}
+        for name, value in entry["headers"]:
+            name = name.decode("latin-1").lower()
+            headers[name] = REDACTED if name in SECRET_HEADERS else value.decode("latin-1")
+
+        shape = None
+        body = entry.pop("body")
+        if body and "json" in entry["content_type"]:
+            try:
+                shape = body_shape(json.loads(body))
+            except ValueError:
+                shape = None
+
+        entry["headers"] = headers
+        entry["query"] = _redact_query(entry["query"])
+        entry["body_shape"] = shape
+        return json.dumps(entry, separators=(",", ":"))
+
+    def _write_loop(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = RotatingFileHandler(
+            self.path,
+            maxBytes=self._max_bytes,
+            backupCount=self._backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        try:
+            while True:
+                entry = self._queue.get()
+                if entry is _STOP:
+                    return
+                try:
+                    line = self._to_line(entry)
+                    # The handler owns rotation; the record is just a carrier
+                    handler.emit(logging.makeLogRecord({"msg": line}))
+                    self._written.inc()
+                except Exception:
+                    self._failed.inc()
+                    logger.exception(
+                        "Traffic record not written",
+                        extra={"event": "traffic_record_failed"},
+                    )
+        finally:
+            handler.close()
+
+
+class TrafficRecorderMiddleware:
+    """
+    Pure ASGI hook for TrafficRecorder. Unsampled requests cost one
+    random() call; sampled ones keep up to `max_body_bytes` of the
+    request body (size only beyond that) and their status and duration.
+
+    Sits inside RequestContextMiddleware so the request id is known.
+    """
+
+    def __init__(self, app: ASGIApp, recorder: TrafficRecorder):
+        self.app = app
+        self.recorder = recorder
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.recorder.sample():
+            await self.app(scope, receive, send)
+            return
+
+        max_body = self.recorder.max_body_bytes
+        chunks: list[bytes] = []
+        body_bytes = 0
+        status = None
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_bytes += len(chunk)
+                if body_bytes <= max_body:
+                    chunks.append(chunk)
+                else:
+                    chunks.clear()
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            headers = scope["headers"]
+            content_type = next(
+                (value.decode("latin-1") for name, value in headers if name == b"content-type"),
+                "",
+            )
+            route = scope.get("route")
+            self.recorder.submit({
+                "ts": started_at,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "headers": list(headers),
+                "content_type": content_type,
+                "body_bytes": body_bytes,
+                "body": b"".join(chunks) if body_bytes <= max_body else None,
+                "status": status,
+                "duration_ms": round(duration * 1000, 3),
+                "request_id": (scope.get("state") or {}).get("request_id"),
+            })
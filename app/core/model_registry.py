@@ -5,10 +5,29 @@ logger = logging.getLogger(__name__)
 
 
 class ModelRegistry:
+    """
+    Loads models without holding up startup: `start()` runs `load()` in
+    the background, so the app serves (and autoscaling sees it live)
+    while I/O-bound loading is still in progress. Callers that need the
+    model await `wait_loaded()`.
+    """
+
     def __init__(self) -> None:
         self._loaded = False
+        self._task: asyncio.Task | None = None
         self.model = None
 
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self.load())
+
+    async def wait_loaded(self) -> None:
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
     async def load(self) -> None:
         logger.info("Loading model registry...")
         await asyncio.sleep(1)  # simulate I/O
@@ -18,6 +37,13 @@ class ModelRegistry:
 
     async def close(self) -> None:
         logger.info("Closing model registry...")
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
         self.model = None
         self._loaded = False
         logger.info("Model registry closed")
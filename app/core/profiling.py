@@ -0,0 +1,310 @@
+import asyncio
+import itertools
+import random
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.request_context import request_id_ctx
+
+# Leaf frame for samples taken while the request was suspended
+# (awaiting I/O, a worker thread, or its turn on the loop)
+AWAITING_FRAME = "[awaiting]"
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _running_stack(frame) -> list[str]:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _suspended_stack(task: asyncio.Task) -> list[str]:
+    # Await chain of a task that is not on the loop right now (outermost
+    # first); Task.get_stack() would only return the outer coroutine
+    labels = []
+    awaitable = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            break
+        labels.append(_frame_label(frame))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    labels.append(AWAITING_FRAME)
+    return labels
+
+
+@dataclass
+class CapturedProfile:
+    """
+    Wall-clock samples of one request, as collapsed stacks
+    ("outer;...;inner count" lines, the input of flamegraph.pl / speedscope).
+    """
+
+    id: int
+    request_id: str | None
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float = 0.0
+    status: int | None = None
+    samples: int = 0
+    stacks: dict[str, int] = field(default_factory=dict)
+
+    def add(self, stack: list[str]) -> None:
+        key = ";".join(stack)
+        self.stacks[key] = self.stacks.get(key, 0) + 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+class _ActiveProfile:
+    __slots__ = ("profile", "task")
+
+    def __init__(self, profile: CapturedProfile, task: asyncio.Task):
+        self.profile = profile
+        self.task = task
+
+
+class RequestProfiler:
+    """
+    On-demand sampling profiler for individual requests.
+
+    - Off by default; `arm()` selects the next `count` matching requests
+      or `percent` of them, until `duration_seconds` elapses
+    - While a selected request is in flight, a sampler thread reads the
+      event-loop thread's stack every `interval_ms`. Samples are
+      attributed to the request's task: its live stack when it is the
+      running task, its await chain (+ "[awaiting]") otherwise
+    - Finished profiles go into a ring buffer of `max_profiles`
+    """
+
+    def __init__(
+        self,
+        max_profiles: int = 50,
+        interval_ms: float = 5.0,
+        max_samples: int = 20_000,
+    ):
+        self._interval = interval_ms / 1000
+        self._max_samples = max_samples
+        self._profiles: deque[CapturedProfile] = deque(maxlen=max_profiles)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+        # Arming state; `armed` is the only thing read on the hot path
+        self.armed = False
+        self._remaining: int | None = None
+        self._percent: float | None = None
+        self._path_prefix = ""
+        self._expires_at = 0.0
+
+        self._active: list[_ActiveProfile] = []
+        self._sampler: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+
+    # ------------------------------------------------------------------
+    # Control (admin API)
+    # ------------------------------------------------------------------
+
+    def arm(
+        self,
+        count: int | None = None,
+        percent: float | None = None,
+        path_prefix: str = "",
+        duration_seconds: float = 300.0,
+    ) -> None:
+        if (count is None) == (percent is None):
+            raise ValueError("Exactly one of count / percent is required")
+
+        with self._lock:
+            self._remaining = count
+            self._percent = percent
+            self._path_prefix = path_prefix
+            self._expires_at = time.monotonic() + duration_seconds
+            self.armed = True
+
+    def disarm(self) -> None:
+        with self._lock:
+            self.armed = False
+            self._remaining = None
+            self._percent = None
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "armed": self.armed,
+                "remaining": self._remaining,
+                "percent": self._percent,
+                "path_prefix": self._path_prefix,
+                "expires_in_seconds": (
+                    max(0.0, round(self._expires_at - time.monotonic(), 1))
+                    if self.armed else None
+                ),
+                "in_flight": len(self._active),
+                "captured": len(self._profiles),
+            }
+
+    def profiles(self) -> list[CapturedProfile]:
+        with self._lock:
+            return list(self._profiles)
+
+    def get(self, profile_id: int) -> CapturedProfile | None:
+        with self._lock:
+            for profile in self._profiles:
+                if profile.id == profile_id:
+                    return profile
+        return None
+
+    # ------------------------------------------------------------------
+    # Request side (event loop)
+    # ------------------------------------------------------------------
+
+    def select(self, path: str) -> bool:
+        """
+        Decide whether this request is profiled (only called when armed).
+        """
+        with self._lock:
+            if not self.armed:
+                return False
+            if time.monotonic() >= self._expires_at:
+                self.armed = False
+                return False
+            if not path.startswith(self._path_prefix):
+                return False
+
+            if self._remaining is not None:
+                self._remaining -= 1
+                if self._remaining <= 0:
+                    self.armed = False
+                return True
+            return random.random() * 100 < self._percent
+
+    def start(self, method: str, path: str) -> _ActiveProfile:
+        profile = CapturedProfile(
+            id=next(self._ids),
+            request_id=request_id_ctx.get(),
+            method=method,
+            path=path,
+            started_at=datetime.now(timezone.utc),
+        )
+        active = _ActiveProfile(profile, asyncio.current_task())
+
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._active.append(active)
+            if self._sampler is None or not self._sampler.is_alive():
+                self._sampler = threading.Thread(
+                    target=self._sample_loop,
+                    name="request-profiler",
+                    daemon=True,
+                )
+                self._sampler.start()
+        return active
+
+    def finish(self, active: _ActiveProfile, duration: float, status: int | None) -> None:
+        active.profile.duration_ms = round(duration * 1000, 3)
+        active.profile.status = status
+        with self._lock:
+            self._active.remove(active)
+            self._profiles.append(active.profile)
+
+    # ------------------------------------------------------------------
+    # Sampler thread
+    # ------------------------------------------------------------------
+
+    def _sample_once(self) -> bool:
+        with self._lock:
+            active = list(self._active)
+            loop, thread_id = self._loop, self._loop_thread_id
+        if not active:
+            return False
+
+        running = asyncio.current_task(loop)
+        loop_frame = sys._current_frames().get(thread_id)
+
+        stacks = []
+        for entry in active:
+            if entry.profile.samples >= self._max_samples:
+                continue
+            try:
+                if entry.task is running and loop_frame is not None:
+                    stacks.append((entry, _running_stack(loop_frame)))
+                else:
+                    stacks.append((entry, _suspended_stack(entry.task)))
+            except Exception:
+                # The task moved on while we looked; skip this tick
+                continue
+
+        with self._lock:
+            for entry, stack in stacks:
+                # Finished profiles are read by the admin API; never touch them
+                if entry in self._active:
+                    entry.profile.add(stack)
+        return True
+
+    def _sample_loop(self) -> None:
+        while True:
+            if self._sample_once():
+                time.sleep(self._interval)
+                continue
+
+            with self._lock:
+                # Re-checked under the lock: start() may have just added one
+                if not self._active:
+                    self._sampler = None
+                    return
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI hook for RequestProfiler.
+
+    When the profiler is not armed this is one attribute check per
+    request. Must sit inside any BaseHTTPMiddleware so the endpoint runs
+    in the same task that is being sampled.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = self.profiler
+        if (
+            not profiler.armed
+            or scope["type"] != "http"
+            or not profiler.select(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        active = profiler.start(scope["method"], scope["path"])
+        start = time.perf_counter()
+        status = None
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.finish(active, time.perf_counter() - start, status)
@@ -0,0 +1,78 @@
+import glob
+import logging
+import os
+import re
+
+from prometheus_client import (
+    CollectorRegistry,
+    REGISTRY,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+logger = logging.getLogger(__name__)
+
+# <type>_<pid>.db / gauge_<mode>_<pid>.db
+_PID_FILE = re.compile(r"_(\d+)\.db$")
+
+
+def render_metrics(multiproc_dir: str | None) -> bytes:
+    """
+    Exposition text for a scrape.
+
+    Single process: the default in-process registry.
+    Multiprocess (PROMETHEUS_MULTIPROC_DIR set): every worker writes its
+    values to memory-mapped files in that directory; they are merged here
+    on each scrape, so any worker can answer with totals for all of them.
+    """
+    if not multiproc_dir:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=multiproc_dir)
+    return generate_latest(registry)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_dead_workers(multiproc_dir: str) -> list[int]:
+    """
+    Drop live-gauge files of workers that are no longer running.
+
+    Counter / histogram files are kept on purpose: their totals must
+    survive a worker restart or rates would go backwards.
+    """
+    pids = set()
+    for path in glob.glob(os.path.join(multiproc_dir, "*.db")):
+        match = _PID_FILE.search(path)
+        if match:
+            pids.add(int(match.group(1)))
+
+    dead = sorted(pid for pid in pids if pid != os.getpid() and not _pid_alive(pid))
+    for pid in dead:
+        multiprocess.mark_process_dead(pid, multiproc_dir)
+
+    if dead:
+        logger.info(
+            "Removed metrics of dead workers",
+            extra={
+                "event": "metrics_dead_workers_removed",
+                "pids": dead,
+            },
+        )
+    return dead
+
+
+def mark_worker_exit(multiproc_dir: str) -> None:
+    """
+    Remove this worker's live gauges (lifespan shutdown).
+    """
+    multiprocess.mark_process_dead(os.getpid(), multiproc_dir)
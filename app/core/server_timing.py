@@ -0,0 +1,52 @@
+from contextvars import ContextVar
+
+
+class StageTimings:
+    """
+    Per-request latency by stage, filled in by `@traced`.
+
+    Durations are inclusive (a use case includes the password hashing
+    it awaits) and summed when a stage runs more than once.
+    """
+
+    __slots__ = ("stages", "last_end")
+
+    def __init__(self):
+        # name -> [seconds, calls]
+        self.stages: dict[str, list] = {}
+        self.last_end: float | None = None
+
+    def add(self, name: str, start: float, end: float) -> None:
+        entry = self.stages.get(name)
+        if entry is None:
+            self.stages[name] = [end - start, 1]
+        else:
+            entry[0] += end - start
+            entry[1] += 1
+        if self.last_end is None or end > self.last_end:
+            self.last_end = end
+
+    def as_ms(self) -> dict[str, float]:
+        return {name: round(seconds * 1000, 3) for name, (seconds, _) in self.stages.items()}
+
+
+# Set per request by RequestContextMiddleware; mutated in place so
+# stages timed in worker threads / child tasks land in the same object
+server_timing_ctx: ContextVar[StageTimings | None] = ContextVar(
+    "server_timing",
+    default=None,
+)
+
+
+def format_server_timing(metrics: dict[str, float], descriptions: dict[str, str] | None = None) -> str:
+    """
+    `Server-Timing` header value from {name: milliseconds}.
+    """
+    descriptions = descriptions or {}
+    parts = []
+    for name, ms in metrics.items():
+        part = f"{name};dur={ms:.3f}"
+        if name in descriptions:
+            part += f';desc="{descriptions[name]}"'
+        parts.append(part)
+    return ", ".join(parts)
@@ -0,0 +1,28 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupPhases:
+    """
+    Wall time of each named lifespan phase, in milliseconds.
+
+    The lifespan wraps its steps in `phase(name)`, logs the breakdown
+    once startup completes and leaves it on `app.state.startup_phases`
+    for the startup report (tests/benchmarks/startup_report.py).
+    """
+
+    def __init__(self):
+        self.durations_ms: dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations_ms[name] = round((time.perf_counter() - start) * 1000, 3)
+
+    @property
+    def total_ms(self) -> float:
+        return round((time.perf_counter() - self._start) * 1000, 3)
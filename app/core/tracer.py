@@ -1,14 +1,64 @@
+import inspect
+import time
 from opentelemetry import trace
 from functools import wraps
 
+from app.core.config import get_settings
+from app.core.server_timing import server_timing_ctx
+
 tracer = trace.get_tracer("ai_engineer_app")
 
 
+
+def stage_timing_enabled(settings) -> bool:
+    """
+    Stage timings ride on `@traced`: TRACING_ENABLED=false is the fully
+    disabled mode and turns them off too, whatever SERVER_TIMING_ENABLED says.
+    """
+    return settings.tracing_enabled and settings.server_timing_enabled
+
+
+# Read once at import: with tracing disabled, decorated functions are
+# returned untouched (no wrapper frame, no no-op span per call)
+_settings = get_settings()
+_TRACING_ENABLED = _settings.tracing_enabled
+_TIMING_ENABLED = stage_timing_enabled(_settings)
+
+
 def traced(name: str):
+    """
+    Span + Server-Timing stage named `name`, for sync or async functions.
+    """
     def decorator(func):
+        if not (_TRACING_ENABLED or _TIMING_ENABLED):
+            return func
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                timings = server_timing_ctx.get() if _TIMING_ENABLED else None
+                start = time.perf_counter()
+                try:
+                    if _TRACING_ENABLED:
+                        with tracer.start_as_current_span(name):
+                            return await func(*args, **kwargs)
+                    return await func(*args, **kwargs)
+                finally:
+                    if timings is not None:
+                        timings.add(name, start, time.perf_counter())
+            return wrapper
+
         @wraps(func)
-        async def wrapper(*args, **kwargs):
-            with tracer.start_as_current_span(name):
-                return await func(*args, **kwargs)
-        return wrapper
+        def sync_wrapper(*args, **kwargs):
+            timings = server_timing_ctx.get() if _TIMING_ENABLED else None
+            start = time.perf_counter()
+            try:
+                if _TRACING_ENABLED:
+                    with tracer.start_as_current_span(name):
+                        return func(*args, **kwargs)
+                return func(*args, **kwargs)
+            finally:
+                if timings is not None:
+                    timings.add(name, start, time.perf_counter())
+        return sync_wrapper
     return decorator
@@ -8,31 +8,226 @@ Purpose:
 - Export traces to OTLP collector (Jaeger/Tempo/etc.)
 - Avoid terminal noise by default
 - Allow easy temporary console tracing for debugging
+
+Modes (TRACING_* settings):
+- disabled: nothing is installed or imported; `traced` is a pass-through
+- enabled: parent-based ratio sampling, plus an optional keep rule that
+  still exports traces which errored or ran slower than a threshold
 """
 
+import threading
+from collections import OrderedDict
+from typing import Callable, Sequence
+
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import SpanContext, StatusCode, TraceFlags
 
 # Console exporter — useful only for local debugging (kept commented)
 # from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
 
-from app.db.db import engine
+from app.core.config import Settings
 
 
-def setup_tracing(app, service_name: str) -> None:
+class RecordUnsampledSampler(Sampler):
     """
-    Initialize OpenTelemetry tracing.
+    Parent-based ratio sampler that records (without sampling) the
+    traces it does not pick, so the keep rule can still export them.
 
-    What this wires:
-    App → OpenTelemetry SDK → OTLP exporter → Trace backend
+    - root span: TraceIdRatioBased(ratio); a miss becomes RECORD_ONLY
+    - sampled parent: sampled
+    - local recording parent that was not sampled: RECORD_ONLY
+    - remote unsampled parent: dropped (the caller decided)
+    """
 
-    Console exporter is intentionally disabled to prevent terminal spam.
+    def __init__(self, ratio: float):
+        self._root = TraceIdRatioBased(ratio)
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id,
+        name,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        parent_span = trace.get_current_span(parent_context)
+        parent = parent_span.get_span_context()
+
+        if not parent.is_valid:
+            result = self._root.should_sample(
+                parent_context, trace_id, name, kind, attributes, links, trace_state
+            )
+            if result.decision == Decision.DROP:
+                return SamplingResult(Decision.RECORD_ONLY, attributes, trace_state)
+            return result
+
+        if parent.trace_flags.sampled:
+            return SamplingResult(Decision.RECORD_AND_SAMPLE, attributes, parent.trace_state)
+        if not parent.is_remote and parent_span.is_recording():
+            return SamplingResult(Decision.RECORD_ONLY, attributes, parent.trace_state)
+        return SamplingResult(Decision.DROP, None, parent.trace_state)
+
+    def get_description(self) -> str:
+        return f"RecordUnsampledSampler{{{self._root.get_description()}}}"
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    context = span.context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            context.trace_id,
+            context.span_id,
+            context.is_remote,
+            TraceFlags(TraceFlags.SAMPLED),
+            context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class KeepErrorsAndSlowProcessor(SpanProcessor):
+    """
+    Forwards sampled spans to `delegate`; holds recorded-but-unsampled
+    spans per trace until the local root ends, then exports the whole
+    trace only if one of its spans errored or took >= `slow_threshold_ms`.
+
+    At most `max_pending_traces` unfinished traces are held (oldest
+    dropped first), so a root that never ends cannot leak memory.
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        keep_errors: bool = True,
+        slow_threshold_ms: float = 0.0,
+        max_pending_traces: int = 10_000,
+    ):
+        self._delegate = delegate
+        self._keep_errors = keep_errors
+        self._slow_ns = int(slow_threshold_ms * 1_000_000)
+        self._max_pending = max_pending_traces
+        # trace_id -> [spans, keep?]
+        self._pending: OrderedDict[int, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _should_keep(self, span: ReadableSpan) -> bool:
+        if self._keep_errors and span.status.status_code == StatusCode.ERROR:
+            return True
+        return bool(self._slow_ns) and span.end_time - span.start_time >= self._slow_ns
+
+    def on_start(self, span, parent_context=None) -> None:
+        self._delegate.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context.trace_flags.sampled:
+            self._delegate.on_end(span)
+            return
+
+        trace_id = span.context.trace_id
+        local_root = span.parent is None or span.parent.is_remote
+
+        with self._lock:
+            entry = self._pending.get(trace_id)
+            if entry is None:
+                entry = self._pending[trace_id] = [[], False]
+                if len(self._pending) > self._max_pending:
+                    self._pending.popitem(last=False)
+            entry[0].append(span)
+            entry[1] = entry[1] or self._should_keep(span)
+
+            if not local_root:
+                return
+            spans, keep = self._pending.pop(trace_id)
+
+        if keep:
+            for kept in spans:
+                self._delegate.on_end(_as_sampled(kept))
+
+    def shutdown(self) -> None:
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._delegate.force_flush(timeout_millis)
+
+
+class LazySpanExporter(SpanExporter):
+    """
+    Builds the real exporter on first export instead of at startup.
+
+    BatchSpanProcessor exports from its worker thread, so the OTLP/gRPC
+    import and channel setup (~45 ms) move off the cold-start path.
+    """
+
+    def __init__(self, factory: Callable[[], SpanExporter]):
+        self._factory = factory
+        self._exporter: SpanExporter | None = None
+        self._lock = threading.Lock()
+
+    def _get(self) -> SpanExporter:
+        with self._lock:
+            if self._exporter is None:
+                self._exporter = self._factory()
+            return self._exporter
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        return self._get().export(spans)
+
+    def shutdown(self) -> None:
+        if self._exporter is not None:
+            self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        if self._exporter is None:
+            return True
+        return self._exporter.force_flush(timeout_millis)
+
+
+def _otlp_exporter(endpoint: str) -> SpanExporter:
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(
+        endpoint=endpoint,
+        insecure=True
+    )
+
+
+def build_tracer_provider(
+    service_name: str,
+    settings: Settings,
+    exporter: SpanExporter | None = None,
+) -> TracerProvider:
+    """
+    Provider with the configured sampler and export pipeline.
+
+    `exporter` defaults to OTLP gRPC at `tracing_exporter_endpoint`,
+    created lazily on the first export (LazySpanExporter).
     """
 
     # ---------------------------------------------------------
@@ -43,23 +238,33 @@ def setup_tracing(app, service_name: str) -> None:
     })
 
     # ---------------------------------------------------------
-    # 2️⃣ Create tracer provider
+    # 2️⃣ Sampling: parent-based ratio, keep rule on top if enabled
     # ---------------------------------------------------------
-    provider = TracerProvider(resource=resource)
-    trace.set_tracer_provider(provider)
+    keep_rule = settings.tracing_keep_errors or settings.tracing_slow_threshold_ms > 0
+    if keep_rule and settings.tracing_sample_ratio < 1.0:
+        sampler = RecordUnsampledSampler(settings.tracing_sample_ratio)
+    else:
+        keep_rule = False
+        sampler = ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio))
+
+    provider = TracerProvider(resource=resource, sampler=sampler)
 
     # ---------------------------------------------------------
     # 3️⃣ OTLP exporter (production path)
     # Sends spans to collector instead of terminal
     # ---------------------------------------------------------
-    otlp_exporter = OTLPSpanExporter(
-        endpoint="localhost:4317",
-        insecure=True
-    )
+    if exporter is None:
+        endpoint = settings.tracing_exporter_endpoint
+        exporter = LazySpanExporter(lambda: _otlp_exporter(endpoint))
 
-    provider.add_span_processor(
-        BatchSpanProcessor(otlp_exporter)
-    )
+    processor: SpanProcessor = BatchSpanProcessor(exporter)
+    if keep_rule:
+        processor = KeepErrorsAndSlowProcessor(
+            processor,
+            keep_errors=settings.tracing_keep_errors,
+            slow_threshold_ms=settings.tracing_slow_threshold_ms,
+        )
+    provider.add_span_processor(processor)
 
     # ---------------------------------------------------------
     # 4️⃣ OPTIONAL — Console exporter (DEBUG ONLY)
@@ -70,16 +275,41 @@ def setup_tracing(app, service_name: str) -> None:
     #     BatchSpanProcessor(ConsoleSpanExporter())
     # )
 
+    return provider
+
+
+def setup_tracing(app, service_name: str, settings: Settings) -> None:
+    """
+    Initialize OpenTelemetry tracing.
+
+    What this wires:
+    App → OpenTelemetry SDK → OTLP exporter → Trace backend
+
+    Console exporter is intentionally disabled to prevent terminal spam.
+    Does nothing when tracing is disabled.
+    """
+    if not settings.tracing_enabled:
+        return
+
+    provider = build_tracer_provider(service_name, settings)
+    trace.set_tracer_provider(provider)
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+
+    from app.db.db import get_engine
+
     # ---------------------------------------------------------
     # 5️⃣ FastAPI auto-instrumentation
     # Captures request/response spans automatically
+    # (per-message receive/send spans skipped: cost, little signal)
     # ---------------------------------------------------------
-    FastAPIInstrumentor.instrument_app(app)
+    FastAPIInstrumentor.instrument_app(app, exclude_spans=["receive", "send"])
 
     # ---------------------------------------------------------
     # 6️⃣ SQLAlchemy auto-instrumentation
     # Captures DB connect/query spans
     # ---------------------------------------------------------
     SQLAlchemyInstrumentor().instrument(
-        engine=engine.sync_engine
+        engine=get_engine().sync_engine
     )
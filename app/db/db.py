@@ -1,10 +1,17 @@
+from functools import lru_cache
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.db.pool import InstrumentedAsyncQueuePool
+from app.db.query_stats import track_queries
+from app.db.routing import ReplicaSet, RoutingSession
 
 # Load settings (reads from .env)
 settings = get_settings()
@@ -13,18 +20,89 @@ settings = get_settings()
 # DATABASE_URL = f"sqlite+aiosqlite:///{PROJECT_ROOT / 'app' / 'app.db'}"
 
 DATABASE_URL = settings.database_url
-# Create async engine (PostgreSQL via asyncpg)
-engine = create_async_engine(
-    settings.database_url,
-    echo=False,
-    future=True,
-)
 
-# Async session factory
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    expire_on_commit=False,
-)
+
+def build_engine(url: str, cfg: Settings, name: str = "primary") -> AsyncEngine:
+    """
+    Create an async engine with the pool settings from `cfg`.
+
+    - Queue-pooled backends get the instrumented pool (metrics label = `name`)
+    - In-memory SQLite keeps SQLAlchemy's single-connection pool
+    - asyncpg gets a bounded prepared-statement cache per connection
+    - Statements are counted into the current request's QueryStats
+    """
+    db_url = make_url(url)
+    options = {
+        "echo": False,
+        "future": True,
+        "pool_pre_ping": cfg.db_pool_pre_ping,
+        "pool_logging_name": name,
+    }
+
+    in_memory = db_url.get_backend_name() == "sqlite" and db_url.database in (None, "", ":memory:")
+    if not in_memory:
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=cfg.db_pool_size,
+            max_overflow=cfg.db_max_overflow,
+            pool_timeout=cfg.db_pool_timeout_seconds,
+            pool_recycle=cfg.db_pool_recycle_seconds,
+        )
+
+    if db_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": cfg.db_statement_cache_size,
+        }
+
+    engine = create_async_engine(db_url, **options)
+    track_queries(engine)
+    return engine
+
+
+# Engine, replicas and session factory are built on first use, not at
+# import: importing models / repositories (alembic, scripts, tests)
+# does not create pools.
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    # Primary async engine (PostgreSQL via asyncpg)
+    return build_engine(settings.database_url, settings)
+
+
+@lru_cache
+def get_replicas() -> ReplicaSet:
+    # Read replicas (empty unless DATABASE_REPLICA_URLS is set)
+    return ReplicaSet([
+        build_engine(url, settings, name=f"replica{index}")
+        for index, url in enumerate(settings.database_replica_urls, start=1)
+    ])
+
+
+@lru_cache
+def get_session_factory() -> async_sessionmaker:
+    # Async session factory (reads → replicas, writes → primary)
+    return async_sessionmaker(
+        bind=get_engine(),
+        sync_session_class=RoutingSession,
+        replicas=get_replicas(),
+        expire_on_commit=False,
+    )
+
+
+_LAZY = {
+    "engine": get_engine,
+    "replicas": get_replicas,
+    "AsyncSessionLocal": get_session_factory,
+}
+
+
+def __getattr__(name: str):
+    # Old module attributes, resolved on first access
+    if name in _LAZY:
+        return _LAZY[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Declarative base
 Base = declarative_base()
@@ -0,0 +1,49 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_TIMEOUTS,
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that exports checkout wait time,
+    checked-out connections and overflow to Prometheus.
+
+    The `pool` label is the pool's logging name
+    (`pool_logging_name` on the engine), e.g. "primary".
+    """
+
+    @property
+    def _metrics_label(self) -> str:
+        return self._orig_logging_name or "default"
+
+    def _report_usage(self) -> None:
+        label = self._metrics_label
+        DB_POOL_CHECKED_OUT.labels(label).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(label).set(max(self.overflow(), 0))
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.labels(self._metrics_label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(self._metrics_label).observe(
+                time.perf_counter() - start
+            )
+
+        self._report_usage()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._report_usage()
@@ -0,0 +1,73 @@
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryStats:
+    """
+    Statements issued by one request: count, DB time and per-shape counts.
+
+    A shape is the SQL text as sent to the driver (bound parameters are
+    placeholders), so the same query with different ids is one shape,
+    which is exactly what an N+1 loop repeats.
+    """
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement] = self.shapes.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """
+        Shapes executed at least `threshold` times.
+        """
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+
+# Set per request by RequestContextMiddleware. The object is mutated in
+# place, so updates made inside SQLAlchemy's greenlets (which run with a
+# copy of the request's context) are visible to the middleware.
+query_stats_ctx: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats",
+    default=None,
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if query_stats_ctx.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = query_stats_ctx.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    if starts:
+        stats.record(statement, time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context):
+    # Failed statement: after_cursor_execute will not run for it
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def track_queries(engine: AsyncEngine) -> None:
+    """
+    Count statements and DB time into the current request's QueryStats.
+    No-op (one context-var read) outside a request.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,184 @@
+import asyncio
+import itertools
+import logging
+
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.metrics import DB_REPLICA_HEALTHY
+
+logger = logging.getLogger(__name__)
+
+# Session.info key: once set, every statement of the session goes to the primary
+PIN_PRIMARY = "pin_primary"
+
+
+class ReplicaSet:
+    """
+    Read replicas with round-robin selection and health tracking.
+
+    - Replicas are marked down when a statement fails with a
+      disconnect / operational error (automatic failover)
+    - A periodic `SELECT 1` brings them back (or takes them out)
+    """
+
+    def __init__(self, engines: list[AsyncEngine]):
+        self._engines = list(engines)
+        self._healthy = list(self._engines)
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+
+        for replica in self._engines:
+            event.listen(replica.sync_engine, "handle_error", self._on_error)
+            DB_REPLICA_HEALTHY.labels(self._label(replica)).set(1)
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    @property
+    def healthy(self) -> list[AsyncEngine]:
+        return list(self._healthy)
+
+    @staticmethod
+    def _label(replica: AsyncEngine) -> str:
+        return replica.pool._orig_logging_name or repr(replica.url)
+
+    def pick(self) -> AsyncEngine | None:
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def mark_down(self, replica: AsyncEngine) -> None:
+        if replica in self._healthy:
+            self._healthy = [e for e in self._healthy if e is not replica]
+            DB_REPLICA_HEALTHY.labels(self._label(replica)).set(0)
+            logger.warning(
+                "Read replica marked unhealthy",
+                extra={
+                    "event": "db_replica_down",
+                    "replica": self._label(replica),
+                },
+            )
+
+    def mark_up(self, replica: AsyncEngine) -> None:
+        if replica not in self._healthy:
+            # Keep configuration order so round-robin stays stable
+            self._healthy = [e for e in self._engines if e in self._healthy or e is replica]
+            DB_REPLICA_HEALTHY.labels(self._label(replica)).set(1)
+            logger.info(
+                "Read replica back in rotation",
+                extra={
+                    "event": "db_replica_up",
+                    "replica": self._label(replica),
+                },
+            )
+
+    def _on_error(self, context) -> None:
+        replica = next(
+            (e for e in self._engines if e.sync_engine is context.engine),
+            None,
+        )
+        if replica is None:
+            return
+
+        # Lost / refused connections; not bad SQL or constraint violations
+        if context.is_disconnect or isinstance(
+            context.sqlalchemy_exception, exc.OperationalError
+        ):
+            self.mark_down(replica)
+
+    async def check(self) -> None:
+        """
+        Probe every replica once and update its health.
+        """
+        for replica in self._engines:
+            try:
+                async with replica.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            except Exception:
+                self.mark_down(replica)
+            else:
+                self.mark_up(replica)
+
+    async def _run(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Replica health check failed")
+
+    def start(self, interval_seconds: float) -> None:
+        if self._engines and self._task is None:
+            self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a healthy replica and
+    everything else to the primary.
+
+    Stays on the primary for:
+    - writes and flushes
+    - SELECT ... FOR UPDATE
+    - any statement after the session has written (read-your-writes),
+      including Core insert / update / delete and text() statements
+      run through `session.execute`
+    - sessions pinned with `pin_primary()`
+    - no healthy replica (failover)
+    """
+
+    def __init__(self, *args, replicas: ReplicaSet | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._replica: AsyncEngine | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+
+        if (
+            not self._replicas
+            or self._flushing
+            or self.info.get(PIN_PRIMARY)
+            or clause is None
+        ):
+            return primary
+
+        if not isinstance(clause, Select) or clause._for_update_arg is not None:
+            # Core writes bypass flush (no after_flush pin): pin here so
+            # the reads that follow see them
+            self.info[PIN_PRIMARY] = True
+            return primary
+
+        # One replica per session, re-picked only if it failed over
+        if self._replica is None or self._replica not in self._replicas.healthy:
+            self._replica = self._replicas.pick()
+
+        return self._replica.sync_engine if self._replica is not None else primary
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_after_write(session: Session, flush_context) -> None:
+    session.info[PIN_PRIMARY] = True
+
+
+def pin_primary(session) -> None:
+    """
+    Route every following statement of `session` to the primary.
+
+    Use before read-modify-write sequences so the read is not served
+    by a lagging replica.
+    """
+    session.info[PIN_PRIMARY] = True
@@ -0,0 +1,73 @@
+from collections.abc import Callable
+from functools import wraps
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class LazySession:
+    """
+    Request-scoped stand-in for AsyncSession.
+
+    - No AsyncSession (and no pooled connection) exists until the
+      first attribute access, i.e. the first statement
+    - release() closes the underlying session, which hands the
+      connection back to the pool; the proxy stays usable and the
+      next statement checks out a fresh connection
+
+    Pool occupancy therefore follows query time instead of the
+    whole request lifetime (background tasks, serialization).
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        # Session.info survives release (e.g. the primary pin set
+        # after a write, for read-your-writes within the request)
+        self._info: dict = {}
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+            self._session.info.update(self._info)
+        return self._session
+
+    def __getattr__(self, name: str):
+        return getattr(self._get_session(), name)
+
+    async def release(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            self._info = dict(session.info)
+            await session.close()
+
+    async def close(self) -> None:
+        await self.release()
+
+
+def releases_session(func):
+    """
+    Repository method decorator: give the pooled connection back
+    as soon as the call finishes.
+
+    Each repository method is a complete unit of work (reads are
+    mapped to domain objects, writes commit), so nothing is lost by
+    releasing. Plain AsyncSession instances (e.g. in tests) are left
+    untouched.
+
+    Place it above @db_retry/@timeout so release happens once,
+    after all attempts.
+    """
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            if isinstance(self._session, LazySession):
+                await self._session.release()
+
+    return wrapper
@@ -1,11 +1,17 @@
 from functools import lru_cache
 from fastapi import Depends
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.middleware.traffic_recorder import TrafficRecorder
+from app.core.profiling import RequestProfiler
 from app.repositories.health_repository import HealthRepository
+from app.services.audit_buffer import AuditBuffer
 from app.services.audit_service import AuditService
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.audit_repository import AuditRepository
-from app.db.db import AsyncSessionLocal
+from app.db.db import get_session_factory
+from app.db.session import LazySession
+from app.security.password import PasswordHasher
 
 # -------------------------
 # Core / App-Level
@@ -16,6 +22,59 @@ from app.db.db import AsyncSessionLocal
 def settings():
     return get_settings()
 
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    """
+    Process-wide password hasher (owns the bcrypt worker pool).
+    """
+    cfg = settings()
+    return PasswordHasher(
+        executor=cfg.password_hash_executor,
+        workers=cfg.password_hash_workers,
+        max_pending=cfg.password_hash_max_pending,
+    )
+
+@lru_cache
+def get_principal_cache() -> TTLCache:
+    """
+    Process-wide cache of resolved principals, keyed by user id.
+    """
+    cfg = settings()
+    return TTLCache(
+        name="principal",
+        max_entries=cfg.principal_cache_max_entries,
+        ttl_seconds=cfg.principal_cache_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_request_profiler() -> RequestProfiler:
+    """
+    Process-wide on-demand request profiler (idle until armed).
+    """
+    cfg = settings()
+    return RequestProfiler(
+        max_profiles=cfg.profiling_max_profiles,
+        interval_ms=cfg.profiling_interval_ms,
+        max_samples=cfg.profiling_max_samples,
+    )
+
+
+@lru_cache
+def get_traffic_recorder() -> TrafficRecorder:
+    """
+    Process-wide traffic recorder (used only when recording is enabled).
+    """
+    cfg = settings()
+    return TrafficRecorder(
+        path=cfg.traffic_recording_path,
+        sample_rate=cfg.traffic_recording_sample_rate,
+        max_bytes=cfg.traffic_recording_max_bytes,
+        backup_count=cfg.traffic_recording_backup_count,
+        max_body_bytes=cfg.traffic_recording_max_body_bytes,
+    )
+
 # -------------------------
 # DB Session
 # -------------------------
@@ -24,9 +83,16 @@ def settings():
 async def get_db_session() -> AsyncSession:
     """
     FastAPI dependency that provides a transactional async DB session.
+
+    The session is lazy: a pooled connection is checked out at the
+    first statement and returned as soon as the repository call
+    finishes, not when the response has been sent.
     """
-    async with AsyncSessionLocal() as session:
+    session = LazySession(get_session_factory())
+    try:
         yield session
+    finally:
+        await session.release()
 
 # -------------------------
 # Repositories
@@ -38,14 +104,30 @@ def get_audit_repository() -> AuditRepository:
     Uses its own session factory to avoid coupling audit logging
     to the request lifecycle (safe for background/fire-and-forget).
     """
-    return AuditRepository(session_factory=AsyncSessionLocal)
+    return AuditRepository(session_factory=get_session_factory())
 
 
 # -------------------------
 # Services
 # -------------------------
 
+@lru_cache
+def get_audit_buffer() -> AuditBuffer:
+    """
+    Process-wide audit buffer. Started/drained by the app lifespan.
+    """
+    cfg = settings()
+    return AuditBuffer(
+        AuditRepository(session_factory=get_session_factory()),
+        max_size=cfg.audit_buffer_max_size,
+        batch_size=cfg.audit_batch_size,
+        flush_interval_seconds=cfg.audit_flush_interval_seconds,
+        overflow=cfg.audit_buffer_overflow,
+    )
+
+
 def get_audit_service(
     repo: AuditRepository = Depends(get_audit_repository),
+    buffer: AuditBuffer = Depends(get_audit_buffer),
 ) -> AuditService:
-    return AuditService(repo)
\ No newline at end of file
+    return AuditService(repo, buffer)
\ No newline at end of file
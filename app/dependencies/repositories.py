@@ -1,7 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies.deps import get_db_session
+from app.dependencies.deps import get_db_session, get_principal_cache
 from app.domain.interfaces.health_repository import HealthRepository
 from app.domain.interfaces.user_repository import UserRepository
 from app.repositories.health_repository import HealthRepositoryImpl
@@ -15,7 +15,7 @@ def get_user_repository(
     Infrastructure wiring.
     Router does NOT know the concrete repository.
     """
-    return SQLAlchemyUserRepository(session)
+    return SQLAlchemyUserRepository(session, principal_cache=get_principal_cache())
 
 
 def get_health_repository(
@@ -1,4 +1,4 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from app.domain.interfaces.health_repository import HealthRepository
 from app.domain.use_cases.health.check_health_status import CheckHealthStatusUseCase
 from app.domain.use_cases.user.get_current_user import GetCurrentUserUseCase
@@ -7,6 +7,8 @@ from app.domain.use_cases.user.register_user import RegisterUserUseCase
 from app.domain.use_cases.user.login_user import LoginUserUseCase
 
 from app.domain.interfaces.user_repository import UserRepository
+from app.dependencies.deps import get_password_hasher, get_principal_cache
+from app.security.password import PasswordHasher
 from app.dependencies.repositories import (
     get_user_repository,
     get_health_repository,
@@ -30,9 +32,12 @@ def get_liveness_usecase() -> LivenessCheckUseCase:
 
 
 def get_readiness_usecase(
+    request: Request,
     repo: HealthRepository = Depends(get_health_repository),
 ) -> ReadinessCheckUseCase:
-    return ReadinessCheckUseCase(repo)
+    return ReadinessCheckUseCase(
+        repo, getattr(request.app.state, "model_registry", None)
+    )
 
 
 def get_deep_health_usecase(
@@ -43,20 +48,22 @@ def get_deep_health_usecase(
 
 def get_register_user_use_case(
     user_repo: UserRepository = Depends(get_user_repository),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> RegisterUserUseCase:
     """
     Application wiring at the boundary.
     """
-    return RegisterUserUseCase(user_repo)
+    return RegisterUserUseCase(user_repo, password_hasher)
 
 
 def get_login_user_use_case(
     user_repo: UserRepository = Depends(get_user_repository),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> LoginUserUseCase:
     """
     Application wiring at the boundary.
     """
-    return LoginUserUseCase(user_repo)
+    return LoginUserUseCase(user_repo, password_hasher)
 
 
 def get_current_user_use_case(
@@ -65,7 +72,7 @@ def get_current_user_use_case(
     """
     Application wiring at the boundary.
     """
-    return GetCurrentUserUseCase(user_repo)
+    return GetCurrentUserUseCase(user_repo, get_principal_cache())
 
 
 def get_list_users_use_case(
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 from app.domain.event_type import EventType
 from app.db.models.audit_orm import AuditORM
 
@@ -17,3 +17,14 @@ def to_orm(event: AuditEvent) -> AuditORM:
         user_id=str(event.user_id),
         event_type=event.event_type.value,
     )
+
+
+def to_row(event: AuditEvent) -> dict:
+    """
+    Column values for a bulk (multi-row) INSERT.
+    """
+    return {
+        "id": str(uuid4()),
+        "user_id": str(event.user_id),
+        "event_type": event.event_type.value,
+    }
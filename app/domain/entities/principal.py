@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from uuid import UUID
+from app.domain.entities.user_role import UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated identity as asserted by a verified access token.
+
+    Carries only what authorization needs (no DB lookup involved).
+    """
+    id: UUID
+    role: UserRole
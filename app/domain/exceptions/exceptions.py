@@ -28,6 +28,16 @@ class AppException(Exception):
         super().__init__(self.message)
 
 
+class BadRequestError(AppException):
+    """
+    Raised when client-supplied input is malformed
+    (e.g. an invalid pagination cursor).
+    """
+    status_code = 400
+    error_code = "BAD_REQUEST"
+    message = "Bad request"
+
+
 class NotFoundError(AppException):
     """
     Raised when a requested resource does not exist.
@@ -46,6 +56,16 @@ class ServiceError(AppException):
     message = "Internal service error"
 
 
+class ServiceUnavailableError(AppException):
+    """
+    Raised when a bounded resource is saturated and the request
+    is rejected instead of queued.
+    """
+    status_code = 503
+    error_code = "SERVICE_UNAVAILABLE"
+    message = "Service temporarily unavailable"
+
+
 class UserAlreadyExistsError(AppException):
     """
     Raised when attempting to create a user that already exists.
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from uuid import UUID
 from typing import Optional
 from app.domain.entities.user import User
@@ -14,6 +15,24 @@ class UserRepository(ABC):
     async def list_all(self) -> list[User]:
         pass
 
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after_id: str | None = None,
+    ) -> list[User]:
+        """
+        Keyset page: up to `limit` users ordered by id, strictly after `after_id`.
+        """
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 500) -> AsyncIterator[User]:
+        """
+        All users ordered by id, read through a server-side cursor.
+        """
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         pass
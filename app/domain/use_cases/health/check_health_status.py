@@ -1,7 +1,7 @@
 import logging
 from app.core.tracer import traced
 from app.domain.interfaces.health_repository import HealthRepository
-from app.domain.exceptions.exceptions import ServiceError
+from app.domain.exceptions.exceptions import ServiceError, ServiceUnavailableError
 
 logger = logging.getLogger(__name__)
 
@@ -63,16 +63,25 @@ class LivenessCheckUseCase:
 class ReadinessCheckUseCase:
     """
     Verifies system is ready to serve traffic.
-    Checks critical dependencies.
+    Checks critical dependencies, and that the model registry (loaded in
+    the background after startup) has finished loading.
     """
 
-    def __init__(self, repo: HealthRepository):
+    def __init__(self, repo: HealthRepository, model_registry=None):
         self.repo = repo
+        self.model_registry = model_registry
 
     @traced("usecase.check_health")
     async def execute(self) -> str:
         logger.info("Readiness check started")
 
+        if self.model_registry is not None and not self.model_registry.loaded:
+            logger.info(
+                "Readiness check failed: models still loading",
+                extra={"event": "readiness_models_loading"},
+            )
+            raise ServiceUnavailableError("Models still loading")
+
         try:
             await self.repo.fetch_status()
             logger.info("Readiness check passed")
@@ -1,5 +1,7 @@
 import logging
+from dataclasses import replace
 from uuid import UUID
+from app.core.cache import TTLCache
 from app.core.tracer import traced
 from app.domain.interfaces.user_repository import UserRepository
 from app.domain.entities.user import User
@@ -10,8 +12,13 @@ logger = logging.getLogger(__name__)
 
 class GetCurrentUserUseCase:
 
-    def __init__(self, user_repo: UserRepository):
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        principal_cache: TTLCache | None = None,
+    ):
         self.user_repo = user_repo
+        self.principal_cache = principal_cache
 
     @traced("usecase.get_current_user")
     async def execute(self, user_id: UUID | str) -> User:
@@ -20,8 +27,15 @@ class GetCurrentUserUseCase:
 
         - Token validation is handled upstream
         - This use case enforces business validity
+        - Resolved principals are cached for a short TTL
         """
 
+        cache_key = str(user_id)
+        if self.principal_cache is not None:
+            cached = self.principal_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # 1️⃣ Resolution attempt (low-noise)
         logger.debug(
             "Resolving current user",
@@ -61,6 +75,11 @@ class GetCurrentUserUseCase:
                 f"Active user with id '{user_id}' not found"
             )
 
+        if self.principal_cache is not None:
+            # Never keep credentials in the principal cache
+            user = replace(user, password_hash="")
+            self.principal_cache.set(cache_key, user)
+
         # 4️⃣ Successful resolution (debug only)
         logger.debug(
             "Current user resolved successfully",
@@ -1,12 +1,39 @@
+import base64
+import binascii
 import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import List
 from app.core.tracer import traced
 from app.domain.interfaces.user_repository import UserRepository
 from app.domain.entities.user import User
+from app.domain.exceptions.exceptions import BadRequestError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class UserPage:
+    users: List[User]
+    next_cursor: str | None = None
+
+
+def encode_cursor(user_id: str) -> str:
+    return base64.urlsafe_b64encode(user_id.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_id = base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError("Invalid pagination cursor")
+
+    if not after_id:
+        raise BadRequestError("Invalid pagination cursor")
+    return after_id
+
+
 class ListUsersUseCase:
     """
     Retrieve all users.
@@ -17,11 +44,16 @@ class ListUsersUseCase:
         self.user_repo = user_repo
 
     @traced("usecase.list_users")
-    async def execute(self) -> List[User]:
+    async def execute(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> UserPage:
         """
-        Retrieve all users.
+        Retrieve one page of users (keyset pagination on id).
 
         Authorization is enforced at the API layer.
+        `next_cursor` is None on the last page.
         """
 
         # 1️⃣ Attempt (low noise)
@@ -29,10 +61,20 @@ class ListUsersUseCase:
             "Listing users",
             extra={
                 "event": "list_users_attempt",
+                "limit": limit,
+                "has_cursor": cursor is not None,
             },
         )
 
-        users = await self.user_repo.list_all()
+        after_id = decode_cursor(cursor) if cursor else None
+
+        # One extra row tells us whether another page exists
+        users = await self.user_repo.list_page(limit + 1, after_id=after_id)
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(str(users[-1].id))
 
         # 2️⃣ Result summary (important, but not noisy)
         logger.info(
@@ -40,7 +82,32 @@ class ListUsersUseCase:
             extra={
                 "event": "list_users_success",
                 "user_count": len(users),
+                "has_more": next_cursor is not None,
+            },
+        )
+
+        return UserPage(users=users, next_cursor=next_cursor)
+
+    async def stream(self) -> AsyncIterator[User]:
+        """
+        Iterate over every user in constant memory (NDJSON export).
+        """
+        logger.info(
+            "User stream started",
+            extra={
+                "event": "list_users_stream_start",
             },
         )
 
-        return users
+        count = 0
+        async for user in self.user_repo.stream_all():
+            count += 1
+            yield user
+
+        logger.info(
+            "User stream completed",
+            extra={
+                "event": "list_users_stream_success",
+                "user_count": count,
+            },
+        )
@@ -2,7 +2,7 @@ import logging
 from app.core.tracer import traced
 from app.domain.interfaces.user_repository import UserRepository
 from app.domain.exceptions.exceptions import AuthenticationError
-from app.security.password import verify_password
+from app.security.password import PasswordHasher
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +12,9 @@ class LoginUserUseCase:
     Authenticate an existing user using email + password.
     """
 
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, password_hasher: PasswordHasher):
         self._user_repo = user_repo
+        self._password_hasher = password_hasher
 
     @traced("usecase.login_user")
     async def execute(self, email: str, password: str):
@@ -40,7 +41,7 @@ class LoginUserUseCase:
             )
             raise AuthenticationError()
 
-        if not verify_password(password, user.password_hash):
+        if not await self._password_hasher.verify(password, user.password_hash):
             # 3️⃣ Authentication failure (wrong password)
             logger.warning(
                 "User login failed: invalid credentials",
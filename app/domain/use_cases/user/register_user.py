@@ -6,15 +6,16 @@ from app.domain.entities.user import User
 from app.domain.entities.user_role import UserRole
 from app.domain.interfaces.user_repository import UserRepository
 from app.domain.exceptions.exceptions import UserAlreadyExistsError
-from app.security.password import hash_password
+from app.security.password import PasswordHasher
 
 logger = logging.getLogger(__name__)
 
 
 class RegisterUserUseCase:
 
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, password_hasher: PasswordHasher):
         self.user_repo = user_repo
+        self.password_hasher = password_hasher
 
     @traced("usecase.register_user")
     async def execute(
@@ -58,9 +59,11 @@ class RegisterUserUseCase:
             role=role,
         )
 
+        password_hash = await self.password_hasher.hash(password)
+
         created_user = await self.user_repo.create(
             user=user,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
         )
 
         # 3️⃣ Success log
@@ -3,8 +3,6 @@
 import sys
 from pathlib import Path
 
-from app.core.metrics_middleware import MetricsMiddleware
-
 # 🔴 MUST BE FIRST
 ROOT_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT_DIR))
@@ -13,23 +11,33 @@ sys.path.append(str(ROOT_DIR))
 from contextlib import asynccontextmanager
 import logging
 import asyncio
-import uvicorn
 from fastapi import FastAPI
 
-from app.core.logging import setup_logging
+from app.core.logging import flush_logging, setup_logging
+from app.core.log_sampling import build_sampling_filter
 from app.core.config import get_settings
-from app.db.db import engine, Base
+from app.db.db import get_replicas
 from app.core.exception_registry import addGlobalExceptionHandlers
 from app.api.routers import addRouters
 from app.core.model_registry import ModelRegistry
-from app.core.middleware.request_id import RequestIDMiddleware
-
-from app.core.tracing import setup_tracing
+from app.core.middleware.request_context import RequestContextMiddleware
+from app.core.middleware.traffic_recorder import TrafficRecorderMiddleware
+from app.core.prometheus import mark_dead_workers, mark_worker_exit
+from app.core.profiling import ProfilingMiddleware
+from app.core.loop_monitor import LoopMonitor
+from app.core.startup import StartupPhases
+from app.core.tracer import stage_timing_enabled
 
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from app.core.rate_limit import limiter
+from app.dependencies.deps import (
+    get_audit_buffer,
+    get_password_hasher,
+    get_request_profiler,
+    get_traffic_recorder,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,28 +47,78 @@ async def lifespan(app: FastAPI):
     # Startup
     # --------------------
     logger.info("Application startup")
-    registry = ModelRegistry()
-    await registry.load()
-    app.state.model_registry = registry
+    phases = StartupPhases()
+    settings = get_settings()
+
+    # Loads in the background; serving does not wait for it
+    with phases.phase("model_registry"):
+        registry = ModelRegistry()
+        registry.start()
+        app.state.model_registry = registry
+
+    with phases.phase("loop_monitor"):
+        loop_monitor = LoopMonitor(
+            interval_seconds=settings.loop_lag_interval_seconds,
+            block_threshold_ms=settings.loop_block_threshold_ms,
+            detect_blocking=settings.loop_block_detection,
+        )
+        loop_monitor.start()
+
+    with phases.phase("replicas"):
+        get_replicas().start(settings.db_replica_health_interval_seconds)
+
+    with phases.phase("audit_buffer"):
+        get_audit_buffer().start()
+
+    # Multi-worker metrics: forget gauges of workers that died without cleanup
+    if settings.prometheus_multiproc_dir:
+        with phases.phase("prometheus_multiproc"):
+            mark_dead_workers(settings.prometheus_multiproc_dir)
 
     # logging.getLogger(__name__).info("Initializing database")
     # async with engine.begin() as conn:
     #     await conn.run_sync(Base.metadata.create_all)
 
+    app.state.startup_phases = phases.durations_ms
+    logger.info(
+        "Application startup complete",
+        extra={
+            "event": "startup_complete",
+            "startup_ms": phases.total_ms,
+            "phases_ms": phases.durations_ms,
+        },
+    )
+
     yield  # Application runs here
 
     # --------------------
     # Shutdown (future use)
     # --------------------
+    await get_audit_buffer().stop()
+    await loop_monitor.stop()
+    await get_replicas().stop()
     await registry.close()
+    get_password_hasher().shutdown()
+    if settings.traffic_recording_enabled:
+        get_traffic_recorder().close()
+    if settings.prometheus_multiproc_dir:
+        mark_worker_exit(settings.prometheus_multiproc_dir)
     logger.info("Application shutdown")
+    flush_logging()
 
     
 def create_app() -> FastAPI:
     settings = get_settings()
 
     # 1️⃣ Logging first (everything after uses it)
-    setup_logging(settings.log_level)
+    setup_logging(
+        settings.log_level,
+        async_mode=settings.log_async,
+        queue_size=settings.log_queue_size,
+        overflow_policy=settings.log_overflow_policy,
+        sampling_filter=build_sampling_filter(settings),
+        json_compact=settings.log_json_compact,
+    )
     logger.info(
     "FastAPI service starting",
     extra={
@@ -78,19 +136,35 @@ def create_app() -> FastAPI:
     )
 
     # 2️⃣ Tracing second (captures startup + routes)
-    setup_tracing(app, settings.app_name)
+    # (OpenTelemetry SDK, exporter and instrumentors are only imported when enabled)
+    if settings.tracing_enabled:
+        from app.core.tracing import setup_tracing
+
+        setup_tracing(app, settings.app_name, settings)
 
     # 4️⃣ Middleware (order matters)
 
+    # on-demand profiler (innermost: same task as the endpoint)
+    app.add_middleware(ProfilingMiddleware, profiler=get_request_profiler())
+
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     app.add_middleware(SlowAPIMiddleware)
-    
-    # metrics wrapper
-    app.add_middleware(MetricsMiddleware)
 
-    # request id first → available to logs + traces
-    app.add_middleware(RequestIDMiddleware)
+    # sampled request recording for offline replay (inside request id)
+    if settings.traffic_recording_enabled:
+        app.add_middleware(TrafficRecorderMiddleware, recorder=get_traffic_recorder())
+    
+    # request id + metrics (outermost, pure ASGI) → available to logs + traces
+    app.add_middleware(
+        RequestContextMiddleware,
+        max_path_labels=settings.metrics_max_path_labels,
+        access_log=settings.access_log_enabled,
+        query_warn_threshold=settings.db_query_warn_threshold,
+        repeated_statement_threshold=settings.db_repeated_statement_threshold,
+        server_timing=stage_timing_enabled(settings),
+        server_timing_header=settings.server_timing_header,
+    )
     # 5️⃣ Routers
     addRouters(app)
 
@@ -108,6 +182,8 @@ app = create_app()
 
 
 async def main() -> None:
+    import uvicorn  # only when run as a script; uvicorn imports us otherwise
+
     settings = get_settings()
     app = create_app()
     config = uvicorn.Config(
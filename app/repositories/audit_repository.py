@@ -1,6 +1,8 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.domain.audit_event import AuditEvent, to_orm
+from app.db.models.audit_orm import AuditORM
+from app.domain.audit_event import AuditEvent, to_orm, to_row
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
@@ -34,4 +36,28 @@ class AuditRepository:
             except SQLAlchemyError:
                 await session.rollback()
                 logger.exception("AUDIT create_event failed")
-                raise
\ No newline at end of file
+                raise
+
+    async def create_events(self, events: Sequence[AuditEvent]) -> None:
+        """
+        Persist a batch of events with a single multi-row INSERT.
+        """
+        if not events:
+            return
+
+        async with self._session_factory() as session:
+            try:
+                await session.execute(
+                    insert(AuditORM).values([to_row(e) for e in events])
+                )
+                await session.commit()
+
+                logger.debug(
+                    "AUDIT create_events completed",
+                    extra={"count": len(events)},
+                )
+
+            except SQLAlchemyError:
+                await session.rollback()
+                logger.exception("AUDIT create_events failed")
+                raise
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.timeout import timeout
+from app.db.session import releases_session
 from app.domain.interfaces.health_repository import HealthRepository
 from app.db.models.health import HealthStatus
 
@@ -9,6 +10,7 @@ class HealthRepositoryImpl(HealthRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
     
+    @releases_session
     @timeout(seconds=3)
     async def fetch_status(self) -> str:
         result = await self._session.execute(select(HealthStatus).limit(1))
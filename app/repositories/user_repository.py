@@ -1,11 +1,15 @@
+from collections.abc import AsyncIterator
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
 
+from app.core.cache import TTLCache
 from app.core.timeout import timeout
 from app.core.retry import db_retry
 from app.db.models.user_orm import UserORM
+from app.db.routing import pin_primary
+from app.db.session import LazySession, releases_session
 from app.dependencies.deps import settings
 from app.domain.entities.user import User
 from app.domain.interfaces.user_repository import UserRepository
@@ -16,9 +20,15 @@ cfg = settings()
 
 class SQLAlchemyUserRepository(UserRepository):
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        principal_cache: TTLCache | None = None,
+    ):
         self._session = session
+        self._principal_cache = principal_cache
 
+    @releases_session
     @db_retry()
     @timeout(seconds=cfg.db_timeout_seconds)
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
@@ -28,6 +38,7 @@ class SQLAlchemyUserRepository(UserRepository):
         orm_user = result.scalar_one_or_none()
         return orm_to_domain_user(orm_user) if orm_user else None
 
+    @releases_session
     @db_retry()
     @timeout(seconds=cfg.db_timeout_seconds)
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -37,8 +48,9 @@ class SQLAlchemyUserRepository(UserRepository):
         orm_user = result.scalar_one_or_none()
         return orm_to_domain_user(orm_user) if orm_user else None
 
+    @releases_session
     @db_retry()
-    @timeout(seconds=cfg.db_timeout_seconds) 
+    @timeout(seconds=cfg.db_timeout_seconds)
     async def create(
         self,
         user: User,
@@ -64,6 +76,7 @@ class SQLAlchemyUserRepository(UserRepository):
 
         return orm_to_domain_user(orm_user)
     
+    @releases_session
     @db_retry()
     @timeout(seconds=cfg.db_timeout_seconds)
     async def update(self, user: User) -> User:
@@ -71,6 +84,8 @@ class SQLAlchemyUserRepository(UserRepository):
         Save assumes the user already exists OR is created elsewhere.
         This method persists state, not credentials.
         """
+        # Read-modify-write: never read the row from a lagging replica
+        pin_primary(self._session)
         orm_user = await self._session.get(UserORM, str(user.id))
 
         if orm_user is None:
@@ -83,13 +98,52 @@ class SQLAlchemyUserRepository(UserRepository):
         await self._session.commit()
         await self._session.refresh(orm_user)
 
+        # Role / active flag may have changed → drop the cached principal
+        if self._principal_cache is not None:
+            self._principal_cache.invalidate(str(user.id))
+
         return orm_to_domain_user(orm_user)
 
+    @releases_session
     @db_retry()
     @timeout(seconds=cfg.db_timeout_seconds)
     async def list_all(self) -> List[User]:
         result = await self._session.execute(select(UserORM))
         return [orm_to_domain_user(u) for u in result.scalars().all()]
+
+    @releases_session
+    @db_retry()
+    @timeout(seconds=cfg.db_timeout_seconds)
+    async def list_page(
+        self,
+        limit: int,
+        after_id: str | None = None,
+    ) -> List[User]:
+        query = select(UserORM).order_by(UserORM.id).limit(limit)
+        if after_id is not None:
+            query = query.where(UserORM.id > after_id)
+
+        result = await self._session.execute(query)
+        return [orm_to_domain_user(u) for u in result.scalars()]
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[User]:
+        """
+        Constant-memory iteration: rows are fetched `batch_size` at a time
+        from a server-side cursor and mapped one by one.
+
+        No timeout/retry: the stream lives as long as the client reads.
+        """
+        try:
+            result = await self._session.stream_scalars(
+                select(UserORM)
+                .order_by(UserORM.id)
+                .execution_options(yield_per=batch_size)
+            )
+            async for orm_user in result:
+                yield orm_to_domain_user(orm_user)
+        finally:
+            if isinstance(self._session, LazySession):
+                await self._session.release()
     
 
 # class UserRepository:
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.core.profiling import CapturedProfile
+
+
+class ProfilingArmRequest(BaseModel):
+    """
+    Profile the next `count` matching requests, or `percent` of them.
+
+    Exactly one of count / percent. `path_prefix` narrows the match
+    (e.g. "/auth/login"); arming expires after `duration_seconds`.
+    """
+
+    count: int | None = Field(default=None, ge=1, le=1000)
+    percent: float | None = Field(default=None, gt=0, le=100)
+    path_prefix: str = ""
+    duration_seconds: float = Field(default=300, gt=0, le=3600)
+
+    @model_validator(mode="after")
+    def _one_selector(self) -> "ProfilingArmRequest":
+        if (self.count is None) == (self.percent is None):
+            raise ValueError("Provide exactly one of 'count' or 'percent'")
+        return self
+
+
+class ProfilingStatusResponse(BaseModel):
+    armed: bool
+    remaining: int | None
+    percent: float | None
+    path_prefix: str
+    expires_in_seconds: float | None
+    in_flight: int
+    captured: int
+
+
+class ProfileSummaryResponse(BaseModel):
+    id: int
+    request_id: str | None
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float
+    status: int | None
+    samples: int
+
+    @staticmethod
+    def from_profile(profile: CapturedProfile) -> "ProfileSummaryResponse":
+        return ProfileSummaryResponse(
+            id=profile.id,
+            request_id=profile.request_id,
+            method=profile.method,
+            path=profile.path,
+            started_at=profile.started_at,
+            duration_ms=profile.duration_ms,
+            status=profile.status,
+            samples=profile.samples,
+        )
@@ -44,9 +44,14 @@ class UserResponse(BaseModel):
 
 class UserListResponse(BaseModel):
     users: list[UserResponse]
+    next_cursor: str | None = None
 
     @staticmethod
-    def from_domain(users: List[User]) -> "UserListResponse":
+    def from_domain(
+        users: List[User],
+        next_cursor: str | None = None,
+    ) -> "UserListResponse":
         return UserListResponse(
-            users=[UserResponse.from_domain(user) for user in users]
+            users=[UserResponse.from_domain(user) for user in users],
+            next_cursor=next_cursor,
         )
@@ -1,20 +1,23 @@
 from fastapi import Depends
 
 from app.db.models.user_orm import UserORM
+from app.domain.entities.principal import Principal
 from app.domain.entities.user import User
 from app.domain.entities.user_role import UserRole
-from app.security.dependencies import get_current_active_user
+from app.security.dependencies import principal_dependency
 from app.domain.exceptions.exceptions import AuthorizationError
 
 
 def require_role(required_role: UserRole):
     """
     Dependency factory that enforces a single required role.
+
+    In claims-only mode the role comes from the verified token.
     """
 
     def _role_guard(
-        user: User = Depends(get_current_active_user),
-    ) -> User:
+        user: User | Principal = Depends(principal_dependency()),
+    ) -> User | Principal:
         if user.role != required_role:
             raise AuthorizationError("Insufficient permissions")
         return user
@@ -25,11 +28,13 @@ def require_role(required_role: UserRole):
 def require_any_role(*allowed_roles: UserRole):
     """
     Dependency factory that enforces one of the allowed roles.
+
+    In claims-only mode the role comes from the verified token.
     """
 
     def _role_guard(
-        user: User = Depends(get_current_active_user),
-    ) -> User:
+        user: User | Principal = Depends(principal_dependency()),
+    ) -> User | Principal:
         if user.role not in allowed_roles:
             raise AuthorizationError("Insufficient permissions")
         return user
@@ -1,7 +1,11 @@
-from fastapi import Depends
+from uuid import UUID
+from fastapi import Depends, Request
+from app.domain.entities.principal import Principal
 from app.domain.entities.user import User
+from app.domain.entities.user_role import UserRole
 from app.domain.exceptions.exceptions import AuthenticationError
 from app.domain.use_cases.user.get_current_user import GetCurrentUserUseCase
+from app.dependencies.deps import settings
 from app.dependencies.use_cases import get_current_user_use_case
 from app.security.security import get_token_payload
 
@@ -10,7 +14,13 @@ from app.security.security import get_token_payload
 # -------------------------
 
 
+def _mark_principal(request: Request, role: UserRole) -> None:
+    # Read by RequestContextMiddleware (Server-Timing for admins only)
+    request.state.principal_role = role
+
+
 async def get_current_user(
+    request: Request,
     payload: dict = Depends(get_token_payload),
     current_user_use_case: GetCurrentUserUseCase = Depends(get_current_user_use_case),
 ) -> User:
@@ -18,7 +28,9 @@ async def get_current_user(
     if not user_id:
         raise AuthenticationError("Invalid token")
 
-    return await current_user_use_case.execute(user_id)
+    user = await current_user_use_case.execute(user_id)
+    _mark_principal(request, user.role)
+    return user
 
 
 async def get_current_active_user(
@@ -29,3 +41,40 @@ async def get_current_active_user(
     return user
 
 
+async def get_token_principal(
+    request: Request,
+    payload: dict = Depends(get_token_payload),
+) -> Principal:
+    """
+    Claims-only principal: built from the verified token, no DB lookup.
+    """
+    user_id = payload.get("sub")
+    role = payload.get("role")
+    if not user_id or not role:
+        raise AuthenticationError("Invalid token")
+
+    if payload.get("ver") != settings().jwt_token_version:
+        raise AuthenticationError("Token has been revoked")
+
+    try:
+        principal = Principal(id=UUID(user_id), role=UserRole(role))
+    except ValueError:
+        raise AuthenticationError("Invalid token")
+
+    _mark_principal(request, principal.role)
+    return principal
+
+
+def principal_dependency():
+    """
+    Dependency used by authorization guards.
+
+    - Claims-only mode → verified token claims (stateless)
+    - Default → active user loaded through GetCurrentUserUseCase
+
+    Endpoints that need the full User (e.g. /auth/me) should keep
+    depending on get_current_user directly.
+    """
+    if settings().auth_claims_only:
+        return get_token_principal
+    return get_current_active_user
@@ -1,6 +1,10 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.tracer import traced
 from app.domain.entities.user import User
 from app.domain.exceptions.exceptions import AuthenticationError
 
@@ -8,11 +12,34 @@ from app.domain.exceptions.exceptions import AuthenticationError
 
 settings = get_settings()
 
+# Verified payloads keyed by token digest, kept until the token's `exp`.
+# A tampered token has a different digest, so it always takes the full
+# verification path below.
+_verified_tokens = TTLCache(
+    name="jwt",
+    max_entries=settings.jwt_cache_max_entries,
+    ttl_seconds=settings.jwt_access_token_expire_minutes * 60,
+)
 
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@traced("security.decode_token")
 def decode_token(token: str) -> dict:
     """
     Decode and validate a JWT access token.
+
+    Successfully verified payloads are cached until they expire,
+    so repeated requests with the same bearer token skip the
+    signature check.
     """
+    digest = _token_digest(token)
+    cached = _verified_tokens.get(digest)
+    if cached is not None:
+        return dict(cached)
+
     try:
         payload = jwt.decode(
             token,
@@ -29,6 +56,8 @@ def decode_token(token: str) -> dict:
     if datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(tz=timezone.utc):
         raise AuthenticationError("Token expired")
 
+    _verified_tokens.set(digest, dict(payload), ttl_seconds=exp - time.time())
+
     return payload
 
 
@@ -37,14 +66,20 @@ def create_access_token(user: User) -> str:
     Create a JWT access token.
 
     - subject: user identifier (stored in `sub`)
+    - role + token version (`ver`) for claims-only authorization
+    - short lifetime when claims-only authorization is enabled
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.jwt_access_token_expire_minutes
+    lifetime_minutes = (
+        settings.jwt_claims_only_expire_minutes
+        if settings.auth_claims_only
+        else settings.jwt_access_token_expire_minutes
     )
+    expire = datetime.now(timezone.utc) + timedelta(minutes=lifetime_minutes)
 
     payload = {
         "sub": str(user.id),
         "role": user.role.value,
+        "ver": settings.jwt_token_version,
         "exp": expire,
     }
 
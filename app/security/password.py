@@ -1,21 +1,126 @@
-from passlib.context import CryptContext
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
-# Central password hashing context
-_pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
+from app.core.metrics import (
+    PASSWORD_HASH_LATENCY,
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_REJECTED,
 )
+from app.core.tracer import traced
+from app.domain.exceptions.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def _pwd_context():
+    """
+    Central password hashing context, built on first use (passlib and
+    the bcrypt backend stay out of app import / startup).
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+    )
 
 
 def hash_password(password: str) -> str:
     """
     Hash a plaintext password.
+
+    CPU-bound (bcrypt). Do not call from async code directly,
+    use PasswordHasher instead.
     """
-    return _pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """
     Verify a plaintext password against its hash.
+
+    CPU-bound (bcrypt). Do not call from async code directly,
+    use PasswordHasher instead.
+    """
+    return _pwd_context().verify(password, password_hash)
+
+
+class PasswordHasher:
     """
-    return _pwd_context.verify(password, password_hash)
+    Async facade over bcrypt that keeps hashing off the event loop.
+
+    - Work runs in a bounded thread or process pool
+    - At most `max_pending` jobs may be queued or running;
+      further calls fail fast with ServiceUnavailableError (503)
+    """
+
+    def __init__(
+        self,
+        executor: str = "thread",
+        workers: int = 4,
+        max_pending: int = 64,
+    ):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash executor '{executor}'")
+
+        self._executor_kind = executor
+        self._workers = workers
+        self._max_pending = max_pending
+        self._pending = 0
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so importing the app does not spawn workers
+        if self._executor is None:
+            if self._executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers,
+                    thread_name_prefix="password-hash",
+                )
+        return self._executor
+
+    async def _run(self, operation: str, fn, *args):
+        if self._pending >= self._max_pending:
+            PASSWORD_HASH_REJECTED.labels(operation).inc()
+            logger.warning(
+                "Password hashing pool saturated",
+                extra={
+                    "event": "password_hash_rejected",
+                    "operation": operation,
+                    "pending": self._pending,
+                },
+            )
+            raise ServiceUnavailableError("Authentication service is busy, retry later")
+
+        self._pending += 1
+        PASSWORD_HASH_QUEUE_DEPTH.set(self._pending)
+        start = time.perf_counter()
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+            PASSWORD_HASH_QUEUE_DEPTH.set(self._pending)
+            PASSWORD_HASH_LATENCY.labels(operation).observe(
+                time.perf_counter() - start
+            )
+
+    @traced("security.password_hash")
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password)
+
+    @traced("security.password_verify")
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run("verify", verify_password, password, password_hash)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+
+from app.core.metrics import (
+    AUDIT_BUFFER_DEPTH,
+    AUDIT_EVENTS_DROPPED,
+    AUDIT_FLUSH_BATCH_SIZE,
+)
+from app.domain.audit_event import AuditEvent
+from app.repositories.audit_repository import AuditRepository
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AuditBuffer:
+    """
+    Bounded in-memory queue of audit events, flushed in batches.
+
+    - A batch is written with one multi-row INSERT when it reaches
+      `batch_size` events or `flush_interval_seconds` has passed
+    - When the queue is full, `overflow="block"` waits for room
+      (backpressure), `overflow="drop"` discards and counts the event
+    - `stop()` drains everything still queued (lifespan shutdown)
+    """
+
+    def __init__(
+        self,
+        repo: AuditRepository,
+        max_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        overflow: str = "drop",
+    ):
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"Unknown audit buffer overflow policy '{overflow}'")
+
+        self._repo = repo
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._overflow = overflow
+        self._max_size = max_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def put(self, event: AuditEvent) -> bool:
+        """
+        Enqueue an event. Returns False if it was dropped.
+        """
+        if self._overflow == "block":
+            await self._queue.put(event)
+        else:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                AUDIT_EVENTS_DROPPED.labels("buffer_full").inc()
+                return False
+
+        AUDIT_BUFFER_DEPTH.set(self._queue.qsize())
+        return True
+
+    def start(self) -> None:
+        if not self.running:
+            # Fresh queue per start: asyncio queues bind to the running loop
+            self._queue = asyncio.Queue(maxsize=self._max_size)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _next_batch(self) -> tuple[list[AuditEvent], bool]:
+        loop = asyncio.get_running_loop()
+
+        first = await self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = loop.time() + self._flush_interval
+
+        while len(batch) < self._batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    async def _flush(self, batch: list[AuditEvent]) -> None:
+        AUDIT_BUFFER_DEPTH.set(self._queue.qsize())
+        if not batch:
+            return
+
+        try:
+            await self._repo.create_events(batch)
+            AUDIT_FLUSH_BATCH_SIZE.observe(len(batch))
+        except Exception as exc:
+            # Audit must never take the app down; count what was lost
+            AUDIT_EVENTS_DROPPED.labels("flush_failed").inc(len(batch))
+            logger.error(
+                "Audit batch flush failed",
+                extra={
+                    "event": "audit_flush_failed",
+                    "count": len(batch),
+                    "error_type": type(exc).__name__,
+                },
+            )
+
+    async def _run(self) -> None:
+        while True:
+            batch, stopping = await self._next_batch()
+            await self._flush(batch)
+
+            if stopping:
+                break
+
+        # Drain whatever was queued before stop()
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+            if len(pending) == self._batch_size:
+                await self._flush(pending)
+                pending = []
+        await self._flush(pending)
+
+        logger.info("Audit buffer drained", extra={"event": "audit_buffer_drained"})
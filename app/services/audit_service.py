@@ -2,14 +2,17 @@ import logging
 from app.core.tracer import traced
 from app.domain.audit_event import AuditEvent
 from app.domain.event_type import EventType
+from app.domain.exceptions.exceptions import ServiceError
 from app.repositories.audit_repository import AuditRepository
+from app.services.audit_buffer import AuditBuffer
 
 logger = logging.getLogger(__name__)
 
 
 class AuditService:
-    def __init__(self, repo: AuditRepository):
+    def __init__(self, repo: AuditRepository, buffer: AuditBuffer | None = None):
         self._repo = repo
+        self._buffer = buffer
 
     async def log_login(self, user_id: str) -> None:
         await self.log_event(user_id, EventType.USER_LOGIN)
@@ -32,7 +35,13 @@ class AuditService:
                 event_type=event_type,
             )
 
-            await self._repo.create_event(audit_event)
+            if self._buffer is not None and self._buffer.running:
+                # Persisted by the buffer in a batched INSERT (app lifespan)
+                if not await self._buffer.put(audit_event):
+                    raise ServiceError("Audit buffer full, event dropped")
+            else:
+                # No running buffer (scripts, tests) → write directly
+                await self._repo.create_event(audit_event)
 
             # 2️⃣ Audit success
             logger.info(
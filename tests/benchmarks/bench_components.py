@@ -0,0 +1,142 @@
+"""
+Microbenchmarks of the functions that run on every request.
+
+Each case times one call of a hot function in isolation, so a change to
+jwt.py, logging.py, the user mapper, the user schemas, the request-id
+context or the repository decorator stack shows up here before it is
+lost in end-to-end noise (see bench_load for that).
+
+    python -m tests.benchmarks.bench_components --output components.json
+    python -m tests.benchmarks.bench_components --cases jwt --iterations 50000
+
+--cases keeps the cases whose name contains any of the given substrings.
+"""
+
+import argparse
+import asyncio
+import logging
+from uuid import uuid4
+
+from tests.benchmarks.harness import (
+    quiet_app_logging,
+    report,
+    summarize,
+    time_async_calls,
+    time_calls,
+)
+
+quiet_app_logging()
+
+from app.core.logging import JsonFormatter  # noqa: E402
+from app.core.request_context import request_id_ctx  # noqa: E402
+from app.core.retry import db_retry  # noqa: E402
+from app.core.timeout import timeout  # noqa: E402
+from app.db.models.user_orm import UserORM  # noqa: E402
+from app.domain.entities.user import User  # noqa: E402
+from app.domain.entities.user_role import UserRole  # noqa: E402
+from app.repositories.mappers.user_mapper import orm_to_domain_user  # noqa: E402
+from app.schemas.user import UserListResponse, UserResponse  # noqa: E402
+from app.security import jwt  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def make_user(i: int = 0) -> User:
+    return User(
+        id=uuid4(),
+        email=f"user{i}@example.com",
+        is_active=True,
+        role=UserRole.USER,
+        password_hash="$2b$12$" + "x" * 53,
+    )
+
+
+def sync_cases() -> dict:
+    user = make_user()
+    token = jwt.create_access_token(user)
+    users = [make_user(i) for i in range(PAGE_SIZE)]
+    orm = UserORM(
+        id=str(user.id),
+        email=user.email,
+        is_active=user.is_active,
+        role=user.role,
+        password_hash=user.password_hash,
+    )
+
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        "app.domain.use_cases.user.login_user", logging.INFO, __file__, 42,
+        "User login success", None, None,
+    )
+    record.__dict__.update({"event": "user_login_success", "user_id": user.id, "role": "USER"})
+
+    def decode_uncached():
+        jwt._verified_tokens.clear()
+        return jwt.decode_token(token)
+
+    def request_id_set_reset():
+        request_id_ctx.reset(request_id_ctx.set("bench-request-id"))
+
+    return {
+        "jwt.decode_token (cached)": lambda: jwt.decode_token(token),
+        "jwt.decode_token (verify)": decode_uncached,
+        "jwt.create_access_token": lambda: jwt.create_access_token(user),
+        "JsonFormatter.format": lambda: formatter.format(record),
+        "orm_to_domain_user": lambda: orm_to_domain_user(orm),
+        "UserResponse.from_domain": lambda: UserResponse.from_domain(user),
+        f"UserListResponse.from_domain ({PAGE_SIZE})": lambda: UserListResponse.from_domain(users),
+        "request_id_ctx set/reset": request_id_set_reset,
+    }
+
+
+async def _noop() -> None:
+    return None
+
+
+@db_retry()
+@timeout(seconds=5)
+async def _decorated_noop() -> None:
+    return None
+
+
+@timeout(seconds=5)
+async def _timeout_noop() -> None:
+    return None
+
+
+ASYNC_CASES = {
+    "async call (undecorated)": _noop,
+    "@timeout": _timeout_noop,
+    "@db_retry + @timeout": _decorated_noop,
+}
+
+
+async def run_async_cases(selected, iterations: int) -> dict:
+    return {
+        name: summarize(await time_async_calls(fn, iterations))
+        for name, fn in ASYNC_CASES.items()
+        if selected(name)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--cases", nargs="*", help="substring filter on case names")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    def selected(name: str) -> bool:
+        return not args.cases or any(part in name for part in args.cases)
+
+    results = {}
+    for name, fn in sync_cases().items():
+        if selected(name):
+            results[name] = summarize(time_calls(fn, args.iterations))
+    results.update(asyncio.run(run_async_cases(selected, args.iterations)))
+
+    report("Per-request components", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
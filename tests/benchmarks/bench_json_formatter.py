@@ -0,0 +1,90 @@
+"""
+Microbenchmark: JsonFormatter.format before and after the fast path.
+
+legacy:          the pre-optimisation formatter, reproduced below
+current:         app.core.logging.JsonFormatter (default: json.dumps, same bytes)
+current-compact: JsonFormatter(compact=True) (LOG_JSON_COMPACT; orjson if installed)
+
+    python -m tests.benchmarks.bench_json_formatter --iterations 100000 --output formatter.json
+"""
+
+import argparse
+import json
+import logging
+from datetime import date, datetime, timezone
+from uuid import UUID, uuid4
+
+from tests.benchmarks.harness import report, summarize, time_calls
+
+from app.core.logging import STANDARD_ATTRS, JsonFormatter
+from app.core.request_context import request_id_ctx
+
+
+class LegacyJsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        log_record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = request_id_ctx.get()
+        if request_id:
+            log_record["request_id"] = request_id
+        for key, value in record.__dict__.items():
+            if key not in STANDARD_ATTRS:
+                if isinstance(value, (UUID, datetime, date)):
+                    log_record[key] = str(value)
+                else:
+                    log_record[key] = value
+        return json.dumps(log_record)
+
+
+def make_record(extras: dict) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "app.domain.use_cases.user.login_user", logging.INFO, __file__, 42,
+        "User login attempt", None, None,
+    )
+    record.__dict__.update(extras)
+    return record
+
+
+CASES = {
+    "no extras": {},
+    "login extras": {"event": "user_login_attempt", "email": "user@example.com"},
+    "uuid + role extras": {
+        "event": "user_login_success",
+        "user_id": uuid4(),
+        "role": "ADMIN",
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    formatters = {
+        "legacy": LegacyJsonFormatter(),
+        "current": JsonFormatter(),
+        "current-compact": JsonFormatter(compact=True),
+    }
+
+    results = {}
+    token = request_id_ctx.set(str(uuid4()))
+    try:
+        for case, extras in CASES.items():
+            record = make_record(extras)
+            for name, formatter in formatters.items():
+                samples = time_calls(lambda: formatter.format(record), args.iterations)
+                results[f"{name} / {case}"] = summarize(samples)
+    finally:
+        request_id_ctx.reset(token)
+
+    report("JsonFormatter.format", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
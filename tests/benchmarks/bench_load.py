@@ -0,0 +1,225 @@
+"""
+In-process load benchmark of the critical endpoints, with a regression gate.
+
+The real app (create_app, full middleware stack, lifespan) is driven
+through httpx's ASGI transport, so there is no network or server in the
+numbers. Each scenario runs `--requests` calls with `--concurrency`
+callers against a seeded, file-backed SQLite database.
+
+Results are compared to a committed baseline. The script exits 1 if a
+scenario's p95 grows, or its throughput drops, by more than
+`--threshold-pct` (default 25%).
+
+    python -m tests.benchmarks.bench_load                       # run + compare
+    python -m tests.benchmarks.bench_load --concurrency 20 --requests 500
+    python -m tests.benchmarks.bench_load --update-baseline     # after an intended change
+
+Baselines are machine-specific: refresh it on the machine that runs the
+gate, not from a laptop.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from tests.benchmarks.harness import quiet_app_logging, report, summarize
+
+# Environment must be in place before any app module is imported
+_DB_DIR = tempfile.mkdtemp(prefix="bench-load-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/bench.db"
+os.environ.setdefault("TRACING_ENABLED", "false")
+os.environ.setdefault("ACCESS_LOG_ENABLED", "false")
+os.environ.setdefault("LOOP_BLOCK_DETECTION", "false")
+quiet_app_logging()
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.rate_limit import limiter  # noqa: E402
+from app.db.db import Base, get_engine  # noqa: E402
+from app.db.models import audit_orm, health  # noqa: E402,F401  (register tables)
+from app.db.models.user_orm import UserORM  # noqa: E402
+from app.domain.entities.user_role import UserRole  # noqa: E402
+from app.main import create_app  # noqa: E402
+from app.security.password import hash_password  # noqa: E402
+from tests.benchmarks.seed_data import USER_COLUMNS, insert_rows, user_rows  # noqa: E402
+
+BASELINE = Path(__file__).with_name("baselines") / "load.json"
+PASSWORD = "bench-password-1"
+ADMIN_EMAIL = "admin@example.com"
+
+# Endpoints whose cost is dominated by bcrypt get fewer requests
+HASHING_SCENARIOS = {"register", "login"}
+
+
+async def seed(users: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # One real bcrypt hash shared by every seeded user
+        password_hash = hash_password(PASSWORD)
+        await insert_rows(conn, UserORM.__table__, USER_COLUMNS, user_rows(users, password_hash))
+        await conn.execute(insert(UserORM), [{
+            "email": ADMIN_EMAIL,
+            "password_hash": password_hash,
+            "role": UserRole.ADMIN,
+            "is_active": True,
+        }])
+
+
+async def login(client: httpx.AsyncClient, email: str) -> str:
+    response = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def scenarios(user_token: str, admin_token: str, seeded_users: int):
+    """
+    name -> (method, path, kwargs factory, expected status)
+    """
+    counter = itertools.count()
+    user_auth = {"Authorization": f"Bearer {user_token}"}
+    admin_auth = {"Authorization": f"Bearer {admin_token}"}
+
+    return {
+        "register": ("POST", "/auth/register", lambda: {
+            "json": {"email": f"new{next(counter)}@example.com", "password": PASSWORD},
+        }, 201),
+        "login": ("POST", "/auth/login", lambda: {
+            "json": {"email": f"user{next(counter) % seeded_users}@example.com", "password": PASSWORD},
+        }, 200),
+        "me": ("GET", "/auth/me", lambda: {"headers": user_auth}, 200),
+        "users": ("GET", "/auth/users", lambda: {"headers": admin_auth, "params": {"limit": 100}}, 200),
+        "health_ready": ("GET", "/health/ready", dict, 200),
+        "health_deep": ("GET", "/health/deep", dict, 200),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    make_kwargs,
+    expected: int,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    remaining = itertools.count()
+    samples: list[float] = []
+    errors = 0
+
+    async def caller() -> None:
+        nonlocal errors
+        while next(remaining) < requests:
+            kwargs = make_kwargs()
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            samples.append(time.perf_counter() - start)
+            if response.status_code != expected:
+                errors += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    result = summarize(samples, wall_seconds=time.perf_counter() - wall_start)
+    result["errors"] = errors
+    return result
+
+
+def compare(results: dict, baseline: dict, threshold_pct: float) -> list[str]:
+    """
+    Regressions beyond the threshold, as readable lines.
+    """
+    failures = []
+    limit = threshold_pct / 100
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if current["errors"]:
+            failures.append(f"{name}: {current['errors']} unexpected status codes")
+        if base["p95_ms"] and current["p95_ms"] > base["p95_ms"] * (1 + limit):
+            failures.append(f"{name}: p95 {current['p95_ms']:.2f} ms vs baseline {base['p95_ms']:.2f} ms")
+        if base["ops_per_sec"] and current["ops_per_sec"] < base["ops_per_sec"] * (1 - limit):
+            failures.append(
+                f"{name}: {current['ops_per_sec']:.1f} req/s vs baseline {base['ops_per_sec']:.1f} req/s"
+            )
+    return failures
+
+
+async def run(args) -> dict:
+    limiter.enabled = False  # measure the endpoints, not the 5/minute limits
+    await seed(args.users)
+
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        # /health/ready answers 503 until the models are loaded
+        await app.state.model_registry.wait_loaded()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            user_token = await login(client, "user0@example.com")
+            admin_token = await login(client, ADMIN_EMAIL)
+
+            results = {}
+            selected = args.scenarios or list(scenarios(user_token, admin_token, args.users))
+            for name in selected:
+                method, path, make_kwargs, expected = scenarios(user_token, admin_token, args.users)[name]
+                requests = args.hashing_requests if name in HASHING_SCENARIOS else args.requests
+                results[name] = await run_scenario(
+                    client, method, path, make_kwargs, expected, requests, args.concurrency
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=1000, help="per scenario")
+    parser.add_argument("--hashing-requests", type=int, default=100, help="register / login")
+    parser.add_argument("--users", type=int, default=1000, help="seeded users")
+    parser.add_argument("--scenarios", nargs="*", help="subset, e.g. me users")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--threshold-pct", type=float, default=25.0)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    report(f"In-process load (concurrency={args.concurrency})", results, args.output)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "concurrency": args.concurrency,
+            "python": sys.version.split()[0],
+            "results": results,
+        }
+        baseline_path.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nbaseline updated: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"\nno baseline at {baseline_path}; run with --update-baseline")
+        return
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("concurrency") != args.concurrency:
+        print(f"\nbaseline was recorded at concurrency={baseline.get('concurrency')}; not comparing")
+        return
+
+    failures = compare(results, baseline["results"], args.threshold_pct)
+    if failures:
+        print(f"\nREGRESSION (> {args.threshold_pct:.0f}%):")
+        for line in failures:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nno regression beyond {args.threshold_pct:.0f}% of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Before/after latency of the request-context middleware on /health/live.
+
+before: RequestIDMiddleware + MetricsMiddleware (BaseHTTPMiddleware),
+        reproduced below exactly as they were before the ASGI rewrite
+after:  RequestContextMiddleware (pure ASGI, single pass)
+
+Requests are driven straight through the ASGI interface (no HTTP client)
+so the numbers reflect middleware cost, not client overhead.
+
+    python -m tests.benchmarks.bench_middleware --requests 5000 --output middleware.json
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from tests.benchmarks.harness import asgi_get, quiet_app_logging, report, summarize
+
+quiet_app_logging()
+
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.core.metrics import REQUEST_COUNT, REQUEST_ERRORS, REQUEST_LATENCY  # noqa: E402
+from app.core.middleware.request_context import RequestContextMiddleware  # noqa: E402
+from app.core.request_context import request_id_ctx  # noqa: E402
+from app.main import create_app  # noqa: E402
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        token = request_id_ctx.set(request_id)
+        try:
+            response = await call_next(request)
+            response.headers["X-Request-ID"] = request_id
+            return response
+        finally:
+            request_id_ctx.reset(token)
+
+
+class LegacyMetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        method = request.method
+        route = request.scope.get("route")
+        path = route.path if route else request.url.path
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        except Exception:
+            REQUEST_ERRORS.labels(method, path).inc()
+            raise
+        finally:
+            REQUEST_COUNT.labels(method, path, status).inc()
+            REQUEST_LATENCY.labels(method, path).observe(time.perf_counter() - start)
+
+
+def build_app(variant: str):
+    app = create_app()
+    if variant == "before":
+        # Same position in the stack: outermost, request id outside metrics
+        stack = [m for m in app.user_middleware if m.cls is not RequestContextMiddleware]
+        app.user_middleware = [
+            Middleware(LegacyRequestIDMiddleware),
+            Middleware(LegacyMetricsMiddleware),
+            *stack,
+        ]
+    return app
+
+
+async def run_variant(variant: str, requests: int, warmup: int, path: str) -> dict:
+    app = build_app(variant)
+
+    for _ in range(warmup):
+        await asgi_get(app, path)
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        status = await asgi_get(app, path)
+        samples.append(time.perf_counter() - start)
+        assert status == 200, status
+
+    return summarize(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=300)
+    parser.add_argument("--path", default="/health/live")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results = {}
+    for variant in ("before", "after"):
+        results[f"{variant} {args.path}"] = await run_variant(
+            variant, args.requests, args.warmup, args.path
+        )
+
+    report("Request-context middleware", results, args.output)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
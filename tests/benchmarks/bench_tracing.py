@@ -0,0 +1,119 @@
+"""
+Per-request tracing overhead in each tracing mode.
+
+disabled:       no instrumentation, `traced` returns the function as is
+always-on:      ratio 1.0 (the previous default)
+ratio 0.1:      parent-based ratio sampling, no keep rule
+ratio 0.1+keep: ratio sampling, unsampled traces recorded for the
+                error/slow keep rule
+
+Each request goes through FastAPI instrumentation (when enabled) plus
+three nested spans, the shape of a login (use case → repository → query).
+Spans go to a no-op exporter behind the batch processor, as in production,
+so export I/O is not on the request path in any mode.
+
+    python -m tests.benchmarks.bench_tracing --requests 5000 --output tracing.json
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from tests.benchmarks.harness import asgi_get, quiet_app_logging, report, summarize
+
+quiet_app_logging()
+os.environ.pop("OTEL_SDK_DISABLED", None)
+
+from fastapi import FastAPI  # noqa: E402
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor  # noqa: E402
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.core.tracing import build_tracer_provider  # noqa: E402
+
+MODES = {
+    "disabled": None,
+    "always-on": {"tracing_sample_ratio": 1.0},
+    "ratio 0.1": {
+        "tracing_sample_ratio": 0.1,
+        "tracing_keep_errors": False,
+        "tracing_slow_threshold_ms": 0,
+    },
+    "ratio 0.1+keep": {
+        "tracing_sample_ratio": 0.1,
+        "tracing_keep_errors": True,
+        "tracing_slow_threshold_ms": 1000,
+    },
+}
+
+
+class NullExporter(SpanExporter):
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+
+def build_app(overrides: dict | None):
+    app = FastAPI()
+
+    if overrides is None:
+        @app.get("/login")
+        async def login_untraced():
+            return {"ok": True}
+
+        return app, None
+
+    settings = get_settings().model_copy(update={"tracing_enabled": True, **overrides})
+    provider = build_tracer_provider("bench", settings, exporter=NullExporter())
+    tracer = provider.get_tracer("bench")
+
+    @app.get("/login")
+    async def login():
+        with tracer.start_as_current_span("usecase.login_user"):
+            with tracer.start_as_current_span("repository.get_by_email"):
+                with tracer.start_as_current_span("SELECT users"):
+                    pass
+        return {"ok": True}
+
+    FastAPIInstrumentor.instrument_app(
+        app,
+        tracer_provider=provider,
+        exclude_spans=["receive", "send"],
+    )
+    return app, provider
+
+
+async def run_mode(overrides: dict | None, requests: int, warmup: int) -> dict:
+    app, provider = build_app(overrides)
+
+    for _ in range(warmup):
+        await asgi_get(app, "/login")
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        status = await asgi_get(app, "/login")
+        samples.append(time.perf_counter() - start)
+        assert status == 200, status
+
+    if provider is not None:
+        provider.shutdown()
+    return summarize(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=300)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, overrides in MODES.items():
+        results[mode] = await run_mode(overrides, args.requests, args.warmup)
+
+    report("Tracing overhead per request", results, args.output)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
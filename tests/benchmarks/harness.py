@@ -0,0 +1,141 @@
+"""
+Shared helpers for the benchmark scripts in this package.
+
+Benchmarks are plain scripts (`python -m tests.benchmarks.<name>`),
+not pytest tests: timings on shared CI runners are too noisy to assert on.
+Each script prints a table and can write machine-readable JSON (--output).
+"""
+
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+
+def quiet_app_logging() -> None:
+    """
+    Keep the app's JSON logs out of benchmark output.
+    Must run before `app.*` modules are imported.
+    """
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_samples)) - 1)
+    return sorted_samples[rank]
+
+
+def summarize(samples: list[float], wall_seconds: float | None = None) -> dict:
+    """
+    Latency summary in milliseconds for per-operation durations (seconds).
+
+    `wall_seconds` is the elapsed time of the whole run; throughput is
+    derived from it (or from the summed samples for sequential runs).
+    """
+    ordered = sorted(samples)
+    total = wall_seconds if wall_seconds is not None else sum(ordered)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "ops_per_sec": len(ordered) / total if total else 0.0,
+    }
+
+
+def time_calls(fn: Callable[[], object], iterations: int, warmup: int = 100) -> list[float]:
+    """
+    Per-call durations (seconds) of a synchronous callable.
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        start = clock()
+        fn()
+        samples.append(clock() - start)
+    return samples
+
+
+async def time_async_calls(
+    fn: Callable[[], Awaitable[object]],
+    iterations: int,
+    warmup: int = 100,
+) -> list[float]:
+    """
+    Per-call durations (seconds) of a coroutine function, awaited in turn.
+    """
+    for _ in range(warmup):
+        await fn()
+
+    samples = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        start = clock()
+        await fn()
+        samples.append(clock() - start)
+    return samples
+
+
+async def asgi_get(app, path: str) -> int:
+    """
+    One GET straight through the ASGI interface (no HTTP client).
+    Returns the response status.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def report(title: str, results: dict[str, dict], output: str | None = None) -> None:
+    """
+    Print a fixed-width table and optionally write `results` as JSON.
+    """
+    print(f"\n{title}")
+    print(f"{'case':<40} {'count':>8} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<40} {stats['count']:>8} {stats['mean_ms']:>10.4f} {stats['p50_ms']:>10.4f} "
+            f"{stats['p95_ms']:>10.4f} {stats['p99_ms']:>10.4f} {stats['ops_per_sec']:>12.1f}"
+        )
+
+    if output:
+        payload = {
+            "title": title,
+            "python": sys.version.split()[0],
+            "results": results,
+        }
+        Path(output).write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nwritten: {output}")
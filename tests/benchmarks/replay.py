@@ -0,0 +1,189 @@
+"""
+Replay recorded traffic (TrafficRecorderMiddleware JSONL) against a target.
+
+Files are streamed line by line in the order given, so pass rotated
+backups oldest first (traffic.jsonl.2 traffic.jsonl.1 traffic.jsonl).
+Requests start at their recorded offsets divided by --speed; with
+--speed 0 they start as fast as --concurrency allows. When the cap is
+reached, later requests wait and the run falls behind the original
+pacing (reported as "late starts").
+
+Recorded secrets are not in the file: headers recorded as "[redacted]"
+are filled from --header, or dropped. JSON bodies are rebuilt from their
+recorded shape with placeholder values (unique e-mails for *email*
+fields), so replayed writes do not collide.
+
+    python -m tests.benchmarks.replay traffic/traffic.jsonl --target http://127.0.0.1:8000
+    python -m tests.benchmarks.replay traffic/traffic.jsonl --speed 4 --concurrency 50 \\
+        --header "Authorization: Bearer $TOKEN" --output replay.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from collections import defaultdict
+from typing import Iterator
+
+import httpx
+
+from tests.benchmarks.harness import report, summarize
+
+REDACTED = "[redacted]"  # as written by the recorder
+
+# Not replayed: set by the client for the new connection / body
+HOP_HEADERS = frozenset({
+    "host",
+    "content-length",
+    "connection",
+    "transfer-encoding",
+    "keep-alive",
+    "accept-encoding",
+})
+
+# Upper bounds (ms) of the per-route latency histogram; the last is +Inf
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def read_records(paths: list[str]) -> Iterator[dict]:
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def body_from_shape(shape, counter: Iterator[int], key: str = ""):
+    """
+    Placeholder JSON value with the recorded shape.
+    """
+    if isinstance(shape, dict):
+        return {name: body_from_shape(item, counter, name) for name, item in shape.items()}
+    if isinstance(shape, list):
+        return [body_from_shape(shape[0], counter, key)] if shape else []
+    if shape == "str":
+        n = next(counter)
+        if "email" in key.lower():
+            return f"replay{n}@example.com"
+        return f"replay-{key or 'value'}-{n}"
+    return {"int": 1, "float": 1.0, "bool": True, "null": None}.get(shape)
+
+
+def build_request(record: dict, extra_headers: dict[str, str], counter: Iterator[int]) -> dict:
+    headers = {}
+    for name, value in record["headers"].items():
+        if name in HOP_HEADERS:
+            continue
+        if value == REDACTED:
+            if name in extra_headers:
+                headers[name] = extra_headers[name]
+            continue
+        headers[name] = value
+
+    request = {
+        "method": record["method"],
+        "url": record["path"] + (f"?{record['query']}" if record["query"] else ""),
+        "headers": headers,
+    }
+    if record.get("body_shape") is not None:
+        request["content"] = json.dumps(body_from_shape(record["body_shape"], counter))
+    return request
+
+
+def histogram(samples: list[float]) -> dict[str, int]:
+    counts = dict.fromkeys([*(f"le_{b}" for b in BUCKETS_MS), "le_inf"], 0)
+    for seconds in samples:
+        ms = seconds * 1000
+        bucket = next((f"le_{b}" for b in BUCKETS_MS if ms <= b), "le_inf")
+        counts[bucket] += 1
+    return counts
+
+
+async def replay(args) -> tuple[dict, int, float]:
+    extra_headers = {}
+    for header in args.header or []:
+        name, _, value = header.partition(":")
+        extra_headers[name.strip().lower()] = value.strip()
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    slots = asyncio.Semaphore(args.concurrency)
+    counter = itertools.count()
+    tasks: set[asyncio.Task] = set()
+    late = 0
+
+    async def send(client: httpx.AsyncClient, key: str, request: dict) -> None:
+        try:
+            start = time.perf_counter()
+            try:
+                response = await client.request(**request)
+                status = str(response.status_code)
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            samples[key].append(time.perf_counter() - start)
+            statuses[key][status] += 1
+        finally:
+            slots.release()
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.target, limits=limits, timeout=args.timeout) as client:
+        records = read_records(args.files)
+        if args.limit:
+            records = itertools.islice(records, args.limit)
+
+        first_ts = None
+        wall_start = time.perf_counter()
+        for record in records:
+            if first_ts is None:
+                first_ts = record["ts"]
+            if args.speed > 0:
+                due = (record["ts"] - first_ts) / args.speed
+                delay = due - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if slots.locked():
+                late += 1
+            await slots.acquire()
+
+            key = f"{record['method']} {record.get('route') or record['path']}"
+            task = asyncio.create_task(send(client, key, build_request(record, extra_headers, counter)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+        wall = time.perf_counter() - wall_start
+
+    results = {}
+    for key, durations in sorted(samples.items()):
+        results[key] = summarize(durations, wall_seconds=wall)
+        results[key]["statuses"] = dict(statuses[key])
+        results[key]["histogram_ms"] = histogram(durations)
+    return results, late, wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="+", help="recorded JSONL, oldest first")
+    parser.add_argument("--target", default="http://127.0.0.1:8000")
+    parser.add_argument("--speed", type=float, default=1.0, help="pacing multiplier; 0 = unpaced")
+    parser.add_argument("--concurrency", type=int, default=20, help="max requests in flight")
+    parser.add_argument("--header", action="append", help='"Name: value" for redacted headers')
+    parser.add_argument("--limit", type=int, help="replay only the first N records")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results, late, wall = asyncio.run(replay(args))
+    report(f"Replay against {args.target} (speed={args.speed}, concurrency={args.concurrency})", results, args.output)
+
+    print(f"\nwall {wall:.1f}s, late starts (concurrency cap reached): {late}")
+    for key, stats in results.items():
+        buckets = " ".join(f"{bucket[3:]}:{n}" for bucket, n in stats["histogram_ms"].items() if n)
+        print(f"{key:<40} statuses {stats['statuses']}  ms {buckets}")
+
+
+if __name__ == "__main__":
+    main()
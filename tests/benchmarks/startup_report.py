@@ -0,0 +1,213 @@
+"""
+Cold-start report: where `import app.main` and the lifespan spend time,
+checked against a budget.
+
+A fresh interpreter (`python -X importtime`) imports app.main, then runs
+the lifespan startup and shutdown. The report shows:
+- total import time, split by package (self time of its modules)
+- the slowest app.* modules (cumulative)
+- each lifespan phase (app.state.startup_phases) and shutdown
+
+Each mode is measured in its own interpreters and checked against its
+own section of --budget:
+- default: the shipped configuration (TRACING_ENABLED unset, so tracing
+  is on and the OTel SDK and instrumentations load at import)
+- tracing_off: TRACING_ENABLED=false
+
+Exits 1 when a budget is exceeded. `packages_ms` entries match
+module-name prefixes; a budget of 0 means "must not be imported at
+startup" (heavy subsystems that are meant to load lazily).
+
+    python -m tests.benchmarks.startup_report
+    python -m tests.benchmarks.startup_report --mode default --runs 5 --output startup.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BUDGET = Path(__file__).with_name("baselines") / "startup_budget.json"
+
+# mode -> environment overrides; None removes the variable
+MODES = {
+    "default": {"TRACING_ENABLED": None},
+    "tracing_off": {"TRACING_ENABLED": "false"},
+}
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _child() -> None:
+    """
+    Runs in the measured interpreter; prints one JSON line on stdout.
+    """
+    start = time.perf_counter()
+    import app.main
+
+    import_ms = (time.perf_counter() - start) * 1000
+    app = app.main.app
+
+    async def lifespan() -> tuple[float, float]:
+        context = app.router.lifespan_context(app)
+        begin = time.perf_counter()
+        await context.__aenter__()
+        started = time.perf_counter()
+        await context.__aexit__(None, None, None)
+        return (started - begin) * 1000, (time.perf_counter() - started) * 1000
+
+    startup_ms, shutdown_ms = asyncio.run(lifespan())
+    print(json.dumps({
+        "import_ms": import_ms,
+        "lifespan_startup_ms": startup_ms,
+        "lifespan_shutdown_ms": shutdown_ms,
+        "phases_ms": app.state.startup_phases,
+    }))
+
+
+def parse_importtime(stderr: str, root: str = "app.main") -> list[tuple[str, int, float, float]]:
+    """
+    (module, depth, self_ms, cumulative_ms) for `root` and everything it
+    imported, in -X importtime order (children before their parent).
+    """
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, len(indent) // 2, int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    for index in range(len(rows) - 1, -1, -1):
+        if rows[index][0] == root:
+            depth = rows[index][1]
+            first = index
+            while first > 0 and rows[first - 1][1] > depth:
+                first -= 1
+            return rows[first:index + 1]
+    return []
+
+
+def measure_once(env: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "tests.benchmarks.startup_report", "--child"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(completed.stderr)
+
+    packages: dict[str, float] = defaultdict(float)
+    for name, _, self_ms, _ in modules:
+        packages[name.split(".")[0]] += self_ms
+    result["packages_ms"] = dict(packages)
+    result["modules"] = {name: self_ms for name, _, self_ms, _ in modules}
+    result["app_modules_ms"] = {
+        name: cumulative_ms for name, _, _, cumulative_ms in modules if name.startswith("app.")
+    }
+    return result
+
+
+def check_budget(result: dict, budget: dict) -> list[str]:
+    failures = []
+    for key in ("import_ms", "lifespan_startup_ms", "lifespan_shutdown_ms"):
+        if key in budget and result[key] > budget[key]:
+            failures.append(f"{key}: {result[key]:.1f} ms > budget {budget[key]} ms")
+
+    for prefix, limit in budget.get("packages_ms", {}).items():
+        matched = {
+            name: ms for name, ms in result["modules"].items()
+            if name == prefix or name.startswith(prefix + ".")
+        }
+        spent = sum(matched.values())
+        if limit == 0 and matched:
+            failures.append(f"{prefix}: imported at startup ({len(matched)} modules, {spent:.1f} ms)")
+        elif limit and spent > limit:
+            failures.append(f"{prefix}: {spent:.1f} ms > budget {limit} ms")
+    return failures
+
+
+def measure_mode(mode: str, runs: int) -> dict:
+    env = dict(os.environ)
+    env.setdefault("LOG_LEVEL", "WARNING")
+    for name, value in MODES[mode].items():
+        if value is None:
+            env.pop(name, None)
+        else:
+            env[name] = value
+
+    results = sorted((measure_once(env) for _ in range(runs)), key=lambda r: r["import_ms"])
+    result = results[len(results) // 2]
+    result["import_ms_runs"] = [round(r["import_ms"], 1) for r in results]
+    return result
+
+
+def print_result(mode: str, result: dict, top: int) -> None:
+    print(f"\n=== {mode} ===")
+    print(f"import app.main  {result['import_ms']:8.1f} ms  (runs: {result['import_ms_runs']}, "
+          f"median {statistics.median(result['import_ms_runs']):.1f})")
+    print(f"lifespan startup {result['lifespan_startup_ms']:8.1f} ms")
+    for phase, ms in result["phases_ms"].items():
+        print(f"  {phase:<30} {ms:8.1f} ms")
+    print(f"lifespan shutdown{result['lifespan_shutdown_ms']:8.1f} ms")
+
+    print(f"\nimport self time by package (top {top})")
+    for name, ms in sorted(result["packages_ms"].items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {name:<30} {ms:8.1f} ms")
+
+    print(f"\nslowest app modules, cumulative (top {top})")
+    for name, ms in sorted(result["app_modules_ms"].items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {name:<50} {ms:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", choices=[*MODES, "all"], default="all")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters; the median run is reported")
+    parser.add_argument("--budget", default=str(BUDGET))
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return
+
+    modes = list(MODES) if args.mode == "all" else [args.mode]
+    results = {mode: measure_mode(mode, args.runs) for mode in modes}
+    for mode, result in results.items():
+        print_result(mode, result, args.top)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nwritten: {args.output}")
+
+    budget_path = Path(args.budget)
+    if not budget_path.exists():
+        print(f"\nno budget at {budget_path}")
+        return
+    budgets = json.loads(budget_path.read_text())["modes"]
+    failures = [
+        f"{mode}: {line}"
+        for mode, result in results.items()
+        for line in check_budget(result, budgets.get(mode, {}))
+    ]
+    if failures:
+        print("\nOVER BUDGET:")
+        for line in failures:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nwithin budget ({budget_path.name}: {', '.join(modes)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_evicts_least_recently_used_entry():
+    cache = TTLCache(name="test_lru", max_entries=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(name="test_ttl", max_entries=10, ttl_seconds=60)
+
+    cache.set("a", 1, ttl_seconds=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_and_disabled_cache():
+    cache = TTLCache(name="test_invalidate", max_entries=10, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    disabled = TTLCache(name="test_disabled", max_entries=10, ttl_seconds=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
@@ -0,0 +1,57 @@
+import json
+import logging
+import random
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from app.core import logging as app_logging
+from app.core.logging import JsonFormatter
+
+
+def _record(created: float = 1_700_000_000.25, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "héllo %s", ("wörld",), None)
+    record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+def test_default_output_is_byte_identical_to_json_dumps():
+    line = JsonFormatter().format(_record(user_id=UUID(int=1), attempts=2))
+
+    # json.dumps defaults, as the formatter has always written them
+    assert line == (
+        '{"timestamp": "2023-11-14T22:13:20.250000+00:00", "level": "INFO", '
+        '"logger": "app.test", "message": "h\\u00e9llo w\\u00f6rld", '
+        '"user_id": "00000000-0000-0000-0000-000000000001", "attempts": 2}'
+    )
+    assert line == json.dumps(json.loads(line))
+
+
+@pytest.mark.parametrize("orjson_installed", [True, False])
+def test_compact_output_is_compact_utf8_json(monkeypatch, orjson_installed):
+    if orjson_installed and app_logging.orjson is None:
+        pytest.skip("orjson not installed")
+    if not orjson_installed:
+        monkeypatch.setattr(app_logging, "orjson", None)
+
+    line = JsonFormatter(compact=True).format(_record(user_id=UUID(int=1), attempts=2))
+
+    assert line == (
+        '{"timestamp":"2023-11-14T22:13:20.250000+00:00","level":"INFO",'
+        '"logger":"app.test","message":"héllo wörld",'
+        '"user_id":"00000000-0000-0000-0000-000000000001","attempts":2}'
+    )
+
+
+def test_timestamp_matches_datetime_isoformat():
+    formatter = JsonFormatter()
+    rng = random.Random(7)
+    samples = [rng.uniform(1.6e9, 1.8e9) for _ in range(20_000)]
+    # Exact second, and fractions that round up into the next second
+    samples += [1_700_000_000.0, 1_700_000_000.9999996, 1_700_000_059.9999999]
+
+    for created in samples:
+        expected = datetime.fromtimestamp(created, timezone.utc).isoformat()
+        assert formatter._timestamp(created) == expected, created
@@ -0,0 +1,78 @@
+import io
+import json
+import logging
+import threading
+
+from app.core.log_queue import AsyncLogHandler
+from app.core.logging import JsonFormatter
+from app.core.request_context import request_id_ctx
+
+
+class GatedStream(io.StringIO):
+    """Stream whose writes wait until the test opens the gate."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def write(self, text):
+        self.gate.wait(5)
+        return super().write(text)
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+def test_records_are_written_by_the_writer_thread_with_request_id():
+    stream = io.StringIO()
+    handler = AsyncLogHandler(stream, queue_size=10)
+    handler.setFormatter(JsonFormatter())
+
+    token = request_id_ctx.set("req-1")
+    try:
+        handler.emit(_record(logging.INFO, "hello %s" % "world"))
+    finally:
+        request_id_ctx.reset(token)
+
+    handler.flush()
+    handler.close()
+
+    line = json.loads(stream.getvalue())
+    assert line["message"] == "hello world"
+    assert line["request_id"] == "req-1"
+
+
+def test_drop_all_policy_sheds_records_when_full():
+    stream = GatedStream()
+    handler = AsyncLogHandler(stream, queue_size=2, overflow_policy="drop_all", batch_size=1)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for n in range(20):
+        handler.emit(_record(logging.ERROR, f"msg {n}"))
+
+    stream.gate.set()
+    handler.close()
+
+    written = stream.getvalue().splitlines()
+    assert 0 < len(written) < 20
+    assert written[0] == "msg 0"
+
+
+def test_drop_debug_first_keeps_warnings():
+    stream = GatedStream()
+    handler = AsyncLogHandler(stream, queue_size=5, overflow_policy="drop_debug_first", batch_size=1)
+    handler.setFormatter(logging.Formatter("%(levelname)s"))
+
+    for _ in range(10):
+        handler.emit(_record(logging.DEBUG, "noise"))
+
+    waiter = threading.Thread(target=handler.emit, args=(_record(logging.WARNING, "kept"),))
+    waiter.start()
+    stream.gate.set()
+    waiter.join(5)
+    handler.close()
+
+    written = stream.getvalue().splitlines()
+    assert "WARNING" in written
+    assert written.count("DEBUG") < 10
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+
+from app.core.log_sampling import EventSamplingFilter, SamplingRule, parse_rules
+
+
+def _record(level: int, name: str = "test", **extra) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_keeps_one_in_n_by_event():
+    log_filter = EventSamplingFilter([SamplingRule("login", sample_every=5)])
+
+    kept = [log_filter.filter(_record(logging.INFO, event="login")) for _ in range(20)]
+
+    assert kept.count(True) == 4
+    assert kept[0] is True
+
+
+def test_rate_limit_by_logger_prefix_and_warnings_always_pass(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.core.log_sampling.time.monotonic", lambda: now[0])
+    log_filter = EventSamplingFilter([SamplingRule("app.health", rate_per_second=1, burst=2)])
+
+    infos = [log_filter.filter(_record(logging.INFO, "app.health.routes")) for _ in range(5)]
+    assert infos == [True, True, False, False, False]
+    assert log_filter.filter(_record(logging.ERROR, "app.health.routes"))
+    assert log_filter.filter(_record(logging.INFO, "app.other"))
+
+    now[0] += 1.0
+    assert log_filter.filter(_record(logging.INFO, "app.health.routes"))
+    assert not log_filter.filter(_record(logging.INFO, "app.health.routes"))
+
+
+def test_suppressed_counts_are_reported(caplog):
+    log_filter = EventSamplingFilter([SamplingRule("noisy", sample_every=10)])
+    for _ in range(10):
+        log_filter.filter(_record(logging.INFO, event="noisy"))
+
+    with caplog.at_level(logging.INFO, logger="app.core.log_sampling"):
+        log_filter.report()
+
+    [summary] = caplog.records
+    assert summary.event == "log_records_suppressed"
+    assert summary.suppressed == {"noisy": 9}
+
+
+def test_parse_rules():
+    rules = parse_rules("a:sample:10, b.c:rate:0.5:3")
+
+    assert rules == (
+        SamplingRule("a", sample_every=10),
+        SamplingRule("b.c", rate_per_second=0.5, burst=3),
+    )
+    with pytest.raises(ValueError):
+        parse_rules("a:sometimes:3")
+
+
+@pytest.mark.parametrize("event", ["user_login_attempt", "user_login_success", "user_login_failed"])
+def test_default_rules_never_sample_security_events(event):
+    log_filter = EventSamplingFilter()
+
+    kept = [
+        log_filter.filter(_record(logging.INFO, "app.domain.use_cases.user.login_user", event=event))
+        for _ in range(20)
+    ]
+
+    assert all(kept)
@@ -0,0 +1,42 @@
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.loop_monitor import LoopMonitor
+
+
+def blocking_handler_call() -> None:
+    time.sleep(0.3)  # e.g. bcrypt on the loop
+
+
+async def endpoint(scope):
+    blocking_handler_call()
+
+
+@pytest.mark.asyncio
+async def test_blocked_loop_is_reported_with_route_request_id_and_stack(caplog):
+    monitor = LoopMonitor(interval_seconds=0.01, block_threshold_ms=50, detect_blocking=True)
+    lag_before = REGISTRY.get_sample_value("event_loop_lag_seconds_count") or 0.0
+    scope = {
+        "type": "http",
+        "path": "/auth/login",
+        "route": SimpleNamespace(path="/auth/login"),
+        "state": {"request_id": "req-42"},
+    }
+
+    with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await endpoint(scope)
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    [report] = [r for r in caplog.records if r.event == "event_loop_blocked"]
+    assert report.route == "/auth/login"
+    assert report.request_id == "req-42"
+    assert "blocking_handler_call" in report.stack
+    assert REGISTRY.get_sample_value("event_loop_lag_seconds_count") > lag_before
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from app.core.model_registry import ModelRegistry
+from app.domain.exceptions.exceptions import ServiceUnavailableError
+from app.domain.use_cases.health.check_health_status import ReadinessCheckUseCase
+
+
+class GatedRegistry(ModelRegistry):
+    """
+    Loads only once `release` is set, so tests control when loading ends.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def load(self) -> None:
+        await self.release.wait()
+        await super().load()
+
+
+class HealthyRepo:
+    async def fetch_status(self) -> str:
+        return "ok"
+
+
+@pytest.fixture(autouse=True)
+def instant_sleep(monkeypatch):
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda delay: real_sleep(0))
+
+
+@pytest.mark.asyncio
+async def test_wait_loaded_returns_once_loading_finishes():
+    registry = GatedRegistry()
+    registry.start()
+    await asyncio.sleep(0)
+    assert not registry.loaded
+
+    registry.release.set()
+    await registry.wait_loaded()
+
+    assert registry.loaded
+    assert registry.model == {"status": "loaded"}
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_a_load_in_progress():
+    registry = GatedRegistry()
+    registry.start()
+    task = registry._task
+    await asyncio.sleep(0)
+
+    await registry.close()
+
+    assert task.cancelled()
+    assert not registry.loaded
+    assert registry.model is None
+    # Nothing left to wait for after close
+    await registry.wait_loaded()
+
+
+@pytest.mark.asyncio
+async def test_readiness_is_unavailable_until_models_are_loaded():
+    registry = GatedRegistry()
+    registry.start()
+    use_case = ReadinessCheckUseCase(HealthyRepo(), registry)
+
+    with pytest.raises(ServiceUnavailableError):
+        await use_case.execute()
+
+    registry.release.set()
+    await registry.wait_loaded()
+    assert await use_case.execute() == {"status": "ready"}
+    await registry.close()
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.profiling import AWAITING_FRAME, ProfilingMiddleware, RequestProfiler
+
+
+def _scope(path: str) -> dict:
+    return {"type": "http", "method": "GET", "path": path}
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+def busy_handler_work(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def app(scope, receive, send):
+    busy_handler_work(0.05)
+    await asyncio.sleep(0.05)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+
+
+@pytest.mark.asyncio
+async def test_armed_count_profiles_next_matching_requests_only():
+    profiler = RequestProfiler(interval_ms=1)
+    middleware = ProfilingMiddleware(app, profiler)
+    profiler.arm(count=1, path_prefix="/auth/login")
+
+    await middleware(_scope("/health"), _receive, _send)
+    await middleware(_scope("/auth/login"), _receive, _send)
+    await middleware(_scope("/auth/login"), _receive, _send)
+
+    [profile] = profiler.profiles()
+    assert profile.path == "/auth/login"
+    assert profile.status == 200
+    assert not profiler.armed
+
+    collapsed = profile.collapsed()
+    assert "busy_handler_work" in collapsed   # running on the loop
+    assert AWAITING_FRAME in collapsed        # suspended in sleep()
+    assert profiler.get(profile.id) is profile
+
+
+def test_arm_requires_one_selector_and_disarm_stops_selection():
+    profiler = RequestProfiler()
+
+    with pytest.raises(ValueError):
+        profiler.arm(count=1, percent=10)
+
+    profiler.arm(percent=100, duration_seconds=60)
+    assert profiler.select("/any")
+    profiler.disarm()
+    assert not profiler.select("/any")
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.core.prometheus import mark_dead_workers, render_metrics
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+WORKER = """
+from app.core.metrics import AUDIT_BUFFER_DEPTH, REQUEST_COUNT
+REQUEST_COUNT.labels("GET", "/health", 200).inc()
+AUDIT_BUFFER_DEPTH.set(3)
+"""
+
+
+def _run_worker(multiproc_dir: Path) -> None:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+    subprocess.run([sys.executable, "-c", WORKER], cwd=ROOT_DIR, env=env, check=True)
+
+
+def test_scrape_merges_workers_and_dead_workers_drop_live_gauges(tmp_path):
+    _run_worker(tmp_path)
+    _run_worker(tmp_path)
+
+    text = render_metrics(str(tmp_path)).decode()
+    assert 'http_requests_total{method="GET",path="/health",status="200"} 2.0' in text
+    assert "audit_buffer_depth 6.0" in text
+
+    # Both workers have exited: their live gauges go, counter totals stay
+    assert len(mark_dead_workers(str(tmp_path))) == 2
+    text = render_metrics(str(tmp_path)).decode()
+    assert 'http_requests_total{method="GET",path="/health",status="200"} 2.0' in text
+    assert "audit_buffer_depth 6.0" not in text
@@ -0,0 +1,147 @@
+import logging
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.middleware.request_context import OTHER_PATH, RequestContextMiddleware
+from app.core import tracer
+from app.core.tracer import traced
+from app.db.query_stats import query_stats_ctx
+
+
+def _count(method: str, path: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "http_requests_total",
+        {"method": method, "path": path, "status": status},
+    )
+    return value or 0.0
+
+
+@traced("usecase.slow_step")
+async def slow_step():
+    return decode_step()
+
+
+@traced("security.decode_step")
+def decode_step():
+    return {"ok": True}
+
+
+def _app(max_path_labels: int = 200, **middleware_options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/staged")
+    async def staged(request: Request):
+        # What the auth dependencies record for the resolved caller
+        if request.headers.get("x-test-role"):
+            request.state.principal_role = request.headers["x-test-role"]
+        return await slow_step()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/health/ready")
+    async def ready(response: Response, request: Request):
+        if request.headers.get("x-test-not-ready"):
+            response.status_code = 503
+        return {}
+
+    @app.get("/other-route")
+    async def other_route():
+        return {}
+
+    @app.get("/n-plus-one")
+    async def n_plus_one():
+        # What the engine listeners record for a per-row lookup loop
+        for _ in range(6):
+            query_stats_ctx.get().record("SELECT * FROM users WHERE id = ?", 0.002)
+        return {}
+
+    app.add_middleware(
+        RequestContextMiddleware,
+        max_path_labels=max_path_labels,
+        **middleware_options,
+    )
+    return app
+
+
+def test_path_label_is_the_route_template():
+    client = TestClient(_app())
+    before = _count("GET", "/items/{item_id}", "200")
+
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert _count("GET", "/items/{item_id}", "200") == before + 2
+    assert REGISTRY.get_sample_value(
+        "http_requests_total", {"method": "GET", "path": "/items/1", "status": "200"}
+    ) is None
+
+
+def test_unmatched_paths_and_labels_over_the_cap_fold_into_other():
+    client = TestClient(_app(max_path_labels=1))
+    before_404 = _count("GET", OTHER_PATH, "404")
+    before_200 = _count("GET", OTHER_PATH, "200")
+
+    client.get("/wp-admin/setup.php")
+    client.get("/items/1")       # first template takes the only slot
+    client.get("/other-route")   # over the cap
+
+    assert _count("GET", OTHER_PATH, "404") == before_404 + 1
+    assert _count("GET", OTHER_PATH, "200") == before_200 + 1
+    assert REGISTRY.get_sample_value(
+        "http_requests_total", {"method": "GET", "path": "/wp-admin/setup.php", "status": "404"}
+    ) is None
+
+
+def test_db_totals_on_access_log_and_repeated_statement_warning(caplog):
+    client = TestClient(_app())
+
+    with caplog.at_level(logging.INFO):
+        client.get("/n-plus-one")
+
+    [access] = [r for r in caplog.records if r.name == "app.access"]
+    assert access.route == "/n-plus-one"
+    assert access.db_queries == 6
+    assert access.db_time_ms == 12.0
+
+    [warning] = [r for r in caplog.records if getattr(r, "event", None) == "db_statement_repeated"]
+    assert warning.count == 6
+    assert warning.path == "/n-plus-one"
+
+
+def test_successful_probes_are_logged_at_debug(caplog):
+    client = TestClient(_app())
+
+    with caplog.at_level(logging.DEBUG, logger="app.access"):
+        client.get("/health/ready")
+        client.get("/health/ready", headers={"X-Test-Not-Ready": "1"})
+        client.get("/other-route")
+
+    levels = [(r.path, r.status, r.levelno) for r in caplog.records if r.name == "app.access"]
+    assert levels == [
+        ("/health/ready", 200, logging.DEBUG),
+        ("/health/ready", 503, logging.INFO),  # failures stay visible
+        ("/other-route", 200, logging.INFO),
+    ]
+
+
+@pytest.mark.skipif(not tracer._TIMING_ENABLED, reason="stage timing disabled")
+def test_server_timing_header_lists_traced_stages():
+    client = TestClient(_app(server_timing_header=True))
+
+    response = client.get("/staged", headers={"X-Test-Role": "ADMIN"})
+
+    names = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+    assert names == ["security.decode_step", "usecase.slow_step", "db", "serialize", "total"]
+    assert 'db;dur=0.000;desc="0 queries"' in response.headers["server-timing"]
+
+    # Never for anonymous or non-admin callers, even when enabled
+    assert "server-timing" not in client.get("/staged").headers
+    assert "server-timing" not in client.get("/staged", headers={"X-Test-Role": "USER"}).headers
+
+    # Off by default: stages are only logged
+    assert "server-timing" not in TestClient(_app()).get("/staged", headers={"X-Test-Role": "ADMIN"}).headers
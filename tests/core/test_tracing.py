@@ -0,0 +1,108 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import Status, StatusCode
+
+from app.core.config import get_settings
+from app.core.tracer import stage_timing_enabled
+from app.core.tracing import LazySpanExporter, build_tracer_provider
+
+
+@pytest.fixture(autouse=True)
+def sdk_enabled(monkeypatch):
+    monkeypatch.delenv("OTEL_SDK_DISABLED", raising=False)
+
+
+def _provider(**overrides):
+    exporter = InMemorySpanExporter()
+    settings = get_settings().model_copy(update=overrides)
+    return build_tracer_provider("test", settings, exporter=exporter), exporter
+
+
+def _request(tracer, error: bool = False) -> None:
+    with tracer.start_as_current_span("request"):
+        with tracer.start_as_current_span("usecase") as span:
+            if error:
+                span.set_status(Status(StatusCode.ERROR))
+
+
+def test_unsampled_traces_are_exported_only_when_they_error():
+    provider, exporter = _provider(
+        tracing_sample_ratio=0.0,
+        tracing_keep_errors=True,
+        tracing_slow_threshold_ms=0,
+    )
+    tracer = provider.get_tracer("test")
+
+    _request(tracer)
+    _request(tracer, error=True)
+    provider.force_flush()
+
+    spans = exporter.get_finished_spans()
+    assert sorted(span.name for span in spans) == ["request", "usecase"]
+    assert all(span.context.trace_flags.sampled for span in spans)
+    assert len({span.context.trace_id for span in spans}) == 1
+
+
+def test_ratio_zero_without_keep_rule_exports_nothing():
+    provider, exporter = _provider(
+        tracing_sample_ratio=0.0,
+        tracing_keep_errors=False,
+        tracing_slow_threshold_ms=0,
+    )
+    tracer = provider.get_tracer("test")
+
+    _request(tracer, error=True)
+    provider.force_flush()
+
+    assert exporter.get_finished_spans() == ()
+    with tracer.start_as_current_span("request") as span:
+        assert not span.is_recording()
+
+
+def test_lazy_exporter_is_built_on_first_export():
+    built = []
+
+    def factory():
+        built.append(InMemorySpanExporter())
+        return built[-1]
+
+    provider, _ = _provider(tracing_sample_ratio=1.0)
+    lazy = LazySpanExporter(factory)
+    assert lazy.force_flush() and built == []
+
+    tracer = provider.get_tracer("test")
+    with tracer.start_as_current_span("request") as span:
+        pass
+    lazy.export([span])
+    lazy.export([span])
+
+    assert len(built) == 1
+    assert [s.name for s in built[0].get_finished_spans()] == ["request", "request"]
+
+
+def test_tracing_disabled_turns_off_stage_timing():
+    settings = get_settings()
+    off = settings.model_copy(update={"tracing_enabled": False, "server_timing_enabled": True})
+    on = settings.model_copy(update={"tracing_enabled": True, "server_timing_enabled": True})
+
+    assert not stage_timing_enabled(off)
+    assert stage_timing_enabled(on)
+
+
+def test_traced_returns_the_function_itself_when_tracing_is_disabled():
+    # Flags are read at import, so check in a fresh interpreter
+    env = dict(os.environ, TRACING_ENABLED="false")
+    env.pop("SERVER_TIMING_ENABLED", None)  # default: on
+    code = (
+        "from app.core.tracer import traced\n"
+        "def f(): pass\n"
+        "async def g(): pass\n"
+        "assert traced('sync')(f) is f\n"
+        "assert traced('async')(g) is g\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
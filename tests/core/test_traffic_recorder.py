@@ -0,0 +1,97 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.middleware.request_context import RequestContextMiddleware
+from app.core.middleware.traffic_recorder import (
+    REDACTED,
+    TrafficRecorder,
+    TrafficRecorderMiddleware,
+    body_shape,
+)
+from tests.benchmarks.replay import body_from_shape, build_request
+
+
+def _app(recorder: TrafficRecorder) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/auth/login")
+    async def login(payload: dict):
+        return {"ok": True}
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    app.add_middleware(TrafficRecorderMiddleware, recorder=recorder)
+    app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_records_sampled_request_without_secrets(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    recorder = TrafficRecorder(str(path), sample_rate=1.0)
+    client = TestClient(_app(recorder))
+
+    client.post(
+        "/auth/login?api_key=abc&page=2",
+        json={"email": "user@example.com", "password": "hunter22", "scopes": ["a", "b"]},
+        headers={"Authorization": "Bearer secret-token", "X-Request-ID": "req-1"},
+    )
+    recorder.close()
+
+    [record] = _lines(path)
+    assert record["method"] == "POST"
+    assert record["route"] == "/auth/login"
+    assert record["status"] == 200
+    assert record["request_id"] == "req-1"
+    assert record["headers"]["authorization"] == REDACTED
+    assert "api_key=%5Bredacted%5D" in record["query"] and "page=2" in record["query"]
+    assert record["body_shape"] == {"email": "str", "password": "str", "scopes": ["str"]}
+    assert "hunter22" not in path.read_text()
+
+
+def test_unsampled_requests_are_not_recorded(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    recorder = TrafficRecorder(str(path), sample_rate=0.0)
+    TestClient(_app(recorder)).get("/items/1")
+    recorder.close()
+
+    assert not path.exists()
+
+
+def test_rotates_by_size(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    recorder = TrafficRecorder(str(path), sample_rate=1.0, max_bytes=600, backup_count=2)
+    client = TestClient(_app(recorder))
+
+    for i in range(20):
+        client.get(f"/items/{i}")
+    recorder.close()
+
+    assert (tmp_path / "traffic.jsonl.1").exists()
+    assert not (tmp_path / "traffic.jsonl.3").exists()
+
+
+def test_replay_rebuilds_request_from_record():
+    record = {
+        "method": "POST",
+        "path": "/auth/login",
+        "query": "page=2",
+        "headers": {"authorization": REDACTED, "host": "api", "content-type": "application/json"},
+        "body_shape": body_shape({"email": "a@b.co", "password": "x", "remember": True}),
+    }
+    counter = iter(range(100))
+
+    request = build_request(record, {"authorization": "Bearer replay"}, counter)
+
+    assert request["url"] == "/auth/login?page=2"
+    assert request["headers"] == {"authorization": "Bearer replay", "content-type": "application/json"}
+    body = json.loads(request["content"])
+    assert body["email"].endswith("@example.com") and body["remember"] is True
+    assert body_from_shape(["int"], counter) == [1]
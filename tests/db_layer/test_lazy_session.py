@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import text
+
+from app.db.session import LazySession
+from tests.db import AsyncSessionTest, engine_test
+
+
+@pytest.mark.asyncio
+async def test_connection_checked_out_only_between_first_statement_and_release():
+    session = LazySession(AsyncSessionTest)
+
+    assert not session.is_open
+    assert engine_test.pool.checkedout() == 0
+
+    result = await session.execute(text("SELECT 1"))
+    assert result.scalar_one() == 1
+    assert engine_test.pool.checkedout() == 1
+
+    await session.release()
+    assert engine_test.pool.checkedout() == 0
+
+    # Still usable after release
+    result = await session.execute(text("SELECT 2"))
+    assert result.scalar_one() == 2
+
+    await session.close()
+    assert engine_test.pool.checkedout() == 0
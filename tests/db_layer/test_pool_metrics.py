@@ -0,0 +1,57 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import exc, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.db.db import build_engine
+from app.db.pool import InstrumentedAsyncQueuePool
+
+
+def _sample(name: str, pool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": pool}) or 0.0
+
+
+def _settings(**overrides):
+    return get_settings().model_copy(update=overrides)
+
+
+@pytest.mark.asyncio
+async def test_checked_out_gauge_follows_checkout_and_return(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", _settings(), name="test_gauge")
+    assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert _sample("db_pool_checked_out", "test_gauge") == 1
+
+        assert _sample("db_pool_checked_out", "test_gauge") == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_checkout_timeout_is_counted(tmp_path):
+    cfg = _settings(db_pool_size=1, db_max_overflow=0, db_pool_timeout_seconds=0.05)
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", cfg, name="test_timeout")
+    before = _sample("db_pool_timeouts_total", "test_timeout")
+
+    try:
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+        assert _sample("db_pool_timeouts_total", "test_timeout") == before + 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("url", ["sqlite+aiosqlite://", "sqlite+aiosqlite:///:memory:"])
+def test_in_memory_sqlite_keeps_the_default_pool(url):
+    engine = build_engine(url, _settings(), name="test_memory")
+
+    assert not isinstance(engine.pool, InstrumentedAsyncQueuePool)
+    assert isinstance(engine.pool, StaticPool)
+    engine.sync_engine.dispose()
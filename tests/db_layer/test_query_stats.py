@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.db import build_engine
+from app.db.query_stats import QueryStats, query_stats_ctx
+
+
+@pytest.mark.asyncio
+async def test_statements_are_counted_into_the_current_request(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}", get_settings())
+    stats = QueryStats()
+
+    async with engine.connect() as conn:
+        # Outside a request: nothing to record into
+        await conn.execute(text("SELECT 0"))
+
+        token = query_stats_ctx.set(stats)
+        try:
+            for user_id in range(3):
+                await conn.execute(text("SELECT :id"), {"id": user_id})
+            await conn.execute(text("SELECT 2"))
+        finally:
+            query_stats_ctx.reset(token)
+
+    await engine.dispose()
+
+    assert stats.count == 4
+    assert stats.seconds > 0
+    # Same statement, different parameters → one shape
+    assert stats.repeated(3) == {"SELECT ?": 3}
+    assert stats.shapes["SELECT 2"] == 1
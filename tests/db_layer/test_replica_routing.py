@@ -0,0 +1,107 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import get_settings
+from app.db.db import Base, build_engine
+from app.db.models.health import HealthStatus
+from app.db.routing import ReplicaSet, RoutingSession
+from app.db.session import LazySession
+
+
+async def _node(path, name: str, status: str):
+    """SQLite file standing in for one database node, tagged with `status`."""
+    node = build_engine(f"sqlite+aiosqlite:///{path / name}.db", get_settings(), name=name)
+    async with node.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(HealthStatus).values(status=status))
+    return node
+
+
+async def _read(session) -> str:
+    result = await session.execute(select(HealthStatus.status).limit(1))
+    return result.scalar_one()
+
+
+@pytest_asyncio.fixture
+async def cluster(tmp_path):
+    primary = await _node(tmp_path, "primary", "primary")
+    replica1 = await _node(tmp_path, "replica1", "replica1")
+    replica2 = await _node(tmp_path, "replica2", "replica2")
+    replicas = ReplicaSet([replica1, replica2])
+
+    factory = async_sessionmaker(
+        bind=primary,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        expire_on_commit=False,
+    )
+    yield factory, replicas, replica1
+
+    for node in (primary, replica1, replica2):
+        await node.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_are_balanced_across_replicas(cluster):
+    factory, _, _ = cluster
+
+    seen = set()
+    for _ in range(4):
+        async with factory() as session:
+            seen.add(await _read(session))
+
+    assert seen == {"replica1", "replica2"}
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stay_on_primary_across_release(cluster):
+    factory, _, _ = cluster
+    session = LazySession(factory)
+
+    session.add(HealthStatus(status="written"))
+    await session.commit()
+    await session.release()
+
+    result = await session.execute(select(HealthStatus.status).order_by(HealthStatus.id.desc()).limit(1))
+    assert result.scalar_one() == "written"
+    await session.release()
+
+
+@pytest.mark.asyncio
+async def test_core_write_pins_the_session_to_primary(cluster):
+    factory, _, _ = cluster
+    session = LazySession(factory)
+
+    # Core statement: executed directly, never flushed
+    await session.execute(insert(HealthStatus).values(status="core-written"))
+    await session.commit()
+    await session.release()
+
+    result = await session.execute(select(HealthStatus.status).order_by(HealthStatus.id.desc()).limit(1))
+    assert result.scalar_one() == "core-written"
+    await session.release()
+
+
+@pytest.mark.asyncio
+async def test_failed_replica_is_taken_out_of_rotation(cluster):
+    factory, replicas, replica1 = cluster
+    replicas.mark_down(replica1)
+
+    for _ in range(3):
+        async with factory() as session:
+            assert await _read(session) == "replica2"
+
+    await replicas.check()  # replica1 answers again → back in rotation
+    assert replica1 in replicas.healthy
+
+
+@pytest.mark.asyncio
+async def test_all_replicas_down_falls_back_to_primary(cluster):
+    factory, replicas, _ = cluster
+    for replica in replicas.healthy:
+        replicas.mark_down(replica)
+
+    async with factory() as session:
+        assert await _read(session) == "primary"
@@ -0,0 +1,122 @@
+import json
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.routes.auth import protected_router
+from app.core.exception_registry import addGlobalExceptionHandlers
+from app.db.db import Base
+from app.db.models.user_orm import UserORM
+from app.db.session import LazySession
+from app.dependencies.use_cases import get_list_users_use_case
+from app.domain.entities.principal import Principal
+from app.domain.entities.user_role import UserRole
+from app.domain.exceptions.exceptions import BadRequestError
+from app.domain.use_cases.user.list_users import ListUsersUseCase, decode_cursor
+from app.repositories.user_repository import SQLAlchemyUserRepository
+from app.security.dependencies import get_current_active_user, get_token_principal
+
+# Inserted out of order; keyset pagination must return them sorted by id
+USER_IDS = sorted(str(uuid4()) for _ in range(5))
+INSERT_ORDER = [USER_IDS[i] for i in (3, 0, 4, 1, 2)]
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with factory() as session:
+        session.add_all(
+            UserORM(id=user_id, email=f"{user_id}@example.com", password_hash="x", role=UserRole.USER)
+            for user_id in INSERT_ORDER
+        )
+        await session.commit()
+
+    yield factory
+    await engine.dispose()
+
+
+def _ids(users) -> list[str]:
+    return [str(user.id) for user in users]
+
+
+@pytest.mark.asyncio
+async def test_list_page_is_ordered_by_id_and_starts_after_id(session_factory):
+    repo = SQLAlchemyUserRepository(LazySession(session_factory))
+
+    assert _ids(await repo.list_page(3)) == USER_IDS[:3]
+    assert _ids(await repo.list_page(3, after_id=USER_IDS[2])) == USER_IDS[3:]
+    assert await repo.list_page(3, after_id=USER_IDS[-1]) == []
+
+
+@pytest.mark.asyncio
+async def test_cursor_walks_pages_and_last_page_has_no_cursor(session_factory):
+    use_case = ListUsersUseCase(SQLAlchemyUserRepository(LazySession(session_factory)))
+
+    first = await use_case.execute(limit=2)
+    second = await use_case.execute(limit=2, cursor=first.next_cursor)
+    last = await use_case.execute(limit=2, cursor=second.next_cursor)
+
+    assert _ids(first.users + second.users + last.users) == USER_IDS
+    assert decode_cursor(first.next_cursor) == USER_IDS[1]
+    assert last.next_cursor is None
+
+    # Exactly `limit` rows left: the limit+1 fetch finds no further page
+    exact = await use_case.execute(limit=5)
+    assert len(exact.users) == 5 and exact.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!not-base64",
+        "éé",  # non-ASCII
+        "__4",  # valid base64 of b"\xff\xfe": not UTF-8
+        "",
+    ],
+)
+def test_decode_cursor_rejects_malformed_input(cursor):
+    with pytest.raises(BadRequestError):
+        decode_cursor(cursor)
+
+
+def _admin_app(session: LazySession) -> FastAPI:
+    app = FastAPI()
+    app.include_router(protected_router)
+    addGlobalExceptionHandlers(app)
+
+    admin = Principal(id=uuid4(), role=UserRole.ADMIN)
+    app.dependency_overrides[get_current_active_user] = lambda: admin
+    app.dependency_overrides[get_token_principal] = lambda: admin
+    app.dependency_overrides[get_list_users_use_case] = (
+        lambda: ListUsersUseCase(SQLAlchemyUserRepository(session))
+    )
+    return app
+
+
+def test_stream_returns_one_user_per_ndjson_line_and_releases_session(session_factory):
+    session = LazySession(session_factory)
+    client = TestClient(_admin_app(session))
+
+    response = client.get("/auth/users/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == USER_IDS
+    assert not session.is_open
+
+
+def test_invalid_cursor_is_a_400(session_factory):
+    client = TestClient(_admin_app(LazySession(session_factory)))
+
+    response = client.get("/auth/users", params={"cursor": "!!!"})
+
+    assert response.status_code == 400
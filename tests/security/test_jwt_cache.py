@@ -0,0 +1,52 @@
+import time
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+from app.domain.entities.user import User
+from app.domain.entities.user_role import UserRole
+from app.domain.exceptions.exceptions import AuthenticationError
+from app.security.jwt import create_access_token, decode_token, settings
+
+
+def _user() -> User:
+    return User(id=uuid4(), email="cache@example.com", is_active=True, role=UserRole.USER)
+
+
+def test_repeated_decode_returns_independent_payload_copies():
+    token = create_access_token(_user())
+
+    first = decode_token(token)
+    first["role"] = "ADMIN"
+    second = decode_token(token)
+
+    assert second["role"] == UserRole.USER.value
+
+
+def test_tampered_token_rejected_after_valid_token_was_cached():
+    token = create_access_token(_user())
+    decode_token(token)
+
+    header, payload, signature = token.split(".")
+    # Flip a middle character: the low bits of the last one are padding
+    middle = len(signature) // 2
+    flipped = "A" if signature[middle] != "A" else "B"
+    tampered = ".".join([header, payload, signature[:middle] + flipped + signature[middle + 1:]])
+
+    with pytest.raises(AuthenticationError):
+        decode_token(tampered)
+
+
+def test_cached_token_is_rejected_once_expired():
+    token = jwt.encode(
+        {"sub": str(uuid4()), "role": "USER", "exp": int(time.time()) + 1},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+    decode_token(token)
+
+    time.sleep(1.1)
+
+    with pytest.raises(AuthenticationError):
+        decode_token(token)
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from app.domain.exceptions.exceptions import ServiceUnavailableError
+from app.security.password import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip():
+    hasher = PasswordHasher(workers=1, max_pending=2)
+
+    password_hash = await hasher.hash("correct horse")
+
+    assert await hasher.verify("correct horse", password_hash)
+    assert not await hasher.verify("wrong horse", password_hash)
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_pool_is_saturated():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+
+    first = asyncio.create_task(hasher.hash("correct horse"))
+    await asyncio.sleep(0)  # let the first job take the only slot
+
+    with pytest.raises(ServiceUnavailableError):
+        await hasher.hash("another password")
+
+    await first
+    hasher.shutdown()
@@ -0,0 +1,98 @@
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.cache import TTLCache
+from app.db.db import Base
+from app.db.session import LazySession
+from app.domain.entities.user import User
+from app.domain.entities.user_role import UserRole
+from app.domain.exceptions.exceptions import NotFoundError
+from app.domain.use_cases.user.get_current_user import GetCurrentUserUseCase
+from app.repositories.user_repository import SQLAlchemyUserRepository
+
+
+def _user(**overrides) -> User:
+    fields = dict(
+        id=uuid4(),
+        email="user@example.com",
+        is_active=True,
+        role=UserRole.USER,
+        password_hash="$2b$12$secret",
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+def _cache() -> TTLCache:
+    return TTLCache(name="principal-test", max_entries=100, ttl_seconds=60)
+
+
+class CountingRepo:
+    def __init__(self, user: User | None):
+        self.user = user
+        self.calls = 0
+
+    async def get_by_id(self, user_id):
+        self.calls += 1
+        return self.user
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_the_repository_and_drops_the_password_hash():
+    user = _user()
+    repo = CountingRepo(user)
+    use_case = GetCurrentUserUseCase(repo, _cache())
+
+    first = await use_case.execute(user.id)
+    second = await use_case.execute(str(user.id))
+
+    assert repo.calls == 1
+    assert first == second == replace(user, password_hash="")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stored", [None, _user(is_active=False)])
+async def test_missing_or_inactive_users_are_not_cached(stored):
+    user_id = stored.id if stored else uuid4()
+    repo = CountingRepo(stored)
+    cache = _cache()
+    use_case = GetCurrentUserUseCase(repo, cache)
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError):
+            await use_case.execute(user_id)
+
+    assert repo.calls == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_so_a_deactivated_user_is_rejected_next_request(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    cache = _cache()
+
+    def request_scoped():
+        repo = SQLAlchemyUserRepository(LazySession(factory), principal_cache=cache)
+        return repo, GetCurrentUserUseCase(repo, cache)
+
+    try:
+        repo, use_case = request_scoped()
+        user = await repo.create(_user(), password_hash="$2b$12$secret")
+        assert (await use_case.execute(user.id)).is_active
+        assert len(cache) == 1
+
+        repo, _ = request_scoped()
+        await repo.update(replace(user, is_active=False))
+        assert len(cache) == 0
+
+        _, use_case = request_scoped()
+        with pytest.raises(NotFoundError):
+            await use_case.execute(user.id)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from app.domain.entities.principal import Principal
+from app.domain.entities.user_role import UserRole
+from app.domain.exceptions.exceptions import AuthenticationError
+from app.dependencies.deps import settings
+from app.security.dependencies import get_token_principal
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": []})
+
+
+@pytest.mark.asyncio
+async def test_principal_is_built_from_claims():
+    user_id = uuid4()
+    payload = {"sub": str(user_id), "role": "ADMIN", "ver": settings().jwt_token_version}
+
+    request = _request()
+    principal = await get_token_principal(request, payload)
+
+    assert principal == Principal(id=user_id, role=UserRole.ADMIN)
+    # Lets RequestContextMiddleware send Server-Timing to this caller
+    assert request.scope["state"]["principal_role"] == UserRole.ADMIN
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"ver": -1},          # revoked token version
+        {"ver": None},        # token issued before `ver` existed
+        {"role": "ROOT"},     # unknown role
+        {"sub": "not-a-uuid"},
+    ],
+)
+async def test_invalid_claims_are_rejected(overrides):
+    payload = {"sub": str(uuid4()), "role": "USER", "ver": settings().jwt_token_version}
+    payload.update(overrides)
+
+    with pytest.raises(AuthenticationError):
+        await get_token_principal(_request(), payload)
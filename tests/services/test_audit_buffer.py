@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from app.domain.audit_event import AuditEvent
+from app.domain.event_type import EventType
+from app.services.audit_buffer import AuditBuffer
+
+
+class FakeAuditRepository:
+    def __init__(self):
+        self.batches: list[list[AuditEvent]] = []
+
+    async def create_events(self, events):
+        self.batches.append(list(events))
+
+
+def _event(n: int) -> AuditEvent:
+    return AuditEvent(user_id=f"user-{n}", event_type=EventType.USER_LOGIN)
+
+
+@pytest.mark.asyncio
+async def test_flushes_full_batches_and_drains_on_stop():
+    repo = FakeAuditRepository()
+    buffer = AuditBuffer(repo, batch_size=3, flush_interval_seconds=60)
+    buffer.start()
+
+    for n in range(7):
+        assert await buffer.put(_event(n))
+
+    await asyncio.sleep(0.01)
+    assert [len(b) for b in repo.batches] == [3, 3]
+
+    await buffer.stop()
+    assert [len(b) for b in repo.batches] == [3, 3, 1]
+    assert not buffer.running
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_interval():
+    repo = FakeAuditRepository()
+    buffer = AuditBuffer(repo, batch_size=100, flush_interval_seconds=0.01)
+    buffer.start()
+
+    await buffer.put(_event(1))
+    await asyncio.sleep(0.05)
+
+    assert [len(b) for b in repo.batches] == [1]
+    await buffer.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_rejects_when_full():
+    buffer = AuditBuffer(FakeAuditRepository(), max_size=1, overflow="drop")
+
+    assert await buffer.put(_event(1))
+    assert not await buffer.put(_event(2))